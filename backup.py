@@ -2,20 +2,477 @@
 Backup management for Craft Minecraft Server Manager
 """
 
+import atexit
+import errno
+import hashlib
+import io
+import json
+import os
+import queue
 import shutil
+import struct
+import tarfile
 import threading
 import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, MofNCompleteColumn
 
 from config import ConfigManager
 
 console = Console()
 
+# zlib-ng is a drop-in, SIMD-accelerated zlib. When it is installed, point
+# zipfile at it so deflate and CRC32 run on the fast implementation while the
+# archive format stays identical to stdlib output.
+try:
+    from zlib_ng import zlib_ng as zlib
+
+    zipfile.zlib = zlib
+    zipfile.crc32 = zlib.crc32
+except ImportError:
+    import zlib
+
+# zstandard is optional; it enables the "tar.zst" backup format
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Errors that mean an archive's contents are damaged. Anything else (permissions,
+# too many open files, a network filesystem hiccup) only means it couldn't be checked.
+_CORRUPTION_ERRORS = (zipfile.BadZipFile, zlib.error, EOFError, struct.error, tarfile.TarError)
+if zstandard is not None:
+    _CORRUPTION_ERRORS += (zstandard.ZstdError,)
+
+# Suffix given to archives the startup check finds corrupted, instead of deleting them
+QUARANTINE_SUFFIX = ".corrupt"
+
+BACKUP_FILE_EXTENSION = ".zip"
+TAR_ZST_EXTENSION = ".tar.zst"
+BACKUP_EXTENSIONS = (BACKUP_FILE_EXTENSION, TAR_ZST_EXTENSION)
+TMP_EXTENSIONS = tuple(ext + ".tmp" for ext in BACKUP_EXTENSIONS)
+
+# A temporary archive untouched for this long (seconds) was left by a killed
+# backup. Younger ones may belong to a backup running in another craft process.
+STALE_TMP_AGE = 3600
+
+# zstd level for tar.zst backups; level 3 is already faster than deflate level 1
+ZSTD_LEVEL = 3
+BACKUP_LOG_NAME = "backup.log"
+
+# Most log lines the writer thread joins into a single write
+LOG_BATCH_SIZE = 64
+
+# Characters that are not allowed in backup file names, mapped to '_' once at import
+_INVALID_NAME_CHARS = '<>:"/\\|?*'
+_NAME_TRANSLATION = str.maketrans({c: '_' for c in _INVALID_NAME_CHARS})
+MAX_BACKUP_NAME_LENGTH = 50
+
+# Per-file mtime/size record stored inside incremental backups
+MANIFEST_NAME = ".manifest.json"
+
+# Archives that passed a deep check, keyed by name -> [mtime_ns, size], persisted across runs
+BACKUP_INDEX_FILE = ".backup_index.json"
+
+# Named compression tiers accepted wherever a compression level is expected
+COMPRESSION_TIERS = {"store": 0, "fast": 1, "balanced": 6, "max": 9}
+
+# Files above this size are streamed by zipfile instead of being deflated in memory
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+# Most file data queued for or held by the compression workers at once. Bounds
+# backup memory next to the running server regardless of the core count.
+MAX_INFLIGHT_BYTES = 256 * 1024 * 1024
+
+# Read/inflate granularity used when checking archive CRCs
+VERIFY_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of archives whose metadata is kept in memory
+META_CACHE_SIZE = 512
+
+# Size of the reusable buffers used to stream file data in and out of archives
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Write buffer in front of the archive file, so headers and data reach the kernel in large blocks
+ARCHIVE_WRITE_BUFFER = 4 * 1024 * 1024
+
+# Formats that are already compressed (region files, gzipped NBT, jars, media).
+# Deflating them again costs CPU for next to no saving, so they are stored as-is.
+_STORED_EXTS = {'.mca', '.mcc', '.gz', '.jar', '.png', '.ogg'}
+
+_BUFFER_POOL = queue.SimpleQueue()
+
+
+def _advise(fd: int, advice_name: str):
+    """Give the kernel a posix_fadvise hint where supported (Linux/BSD); no-op elsewhere"""
+    advice = getattr(os, advice_name, None)
+    if advice is not None:
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            pass
+
+
+def _acquire_buffer() -> bytearray:
+    """Take a copy buffer from the pool, allocating one if none is free"""
+    try:
+        return _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(COPY_BUFFER_SIZE)
+
+
+def _copy_stream(src, dst) -> int:
+    """Copy src to dst through a pooled buffer, returning the number of bytes copied"""
+    buffer = _acquire_buffer()
+    view = memoryview(buffer)
+    total = 0
+    try:
+        while True:
+            n = src.readinto(buffer)
+            if not n:
+                break
+            dst.write(view[:n])
+            total += n
+    finally:
+        view.release()
+        _BUFFER_POOL.put(buffer)
+    return total
+
+
+def _read_stored_file(file_path: str):
+    """Read a file for a ZIP_STORED entry in one call, returning (crc, size, data)
+
+    The whole file lands in a single buffer, so zlib.crc32 runs once over it
+    in C rather than once per chunk, and no chunk list has to be joined.
+    """
+    with open(file_path, 'rb', buffering=0) as src:
+        _advise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+        data = src.read()
+        _advise(src.fileno(), "POSIX_FADV_DONTNEED")
+    return zlib.crc32(data), len(data), data
+
+
+def _compress_file(file_path: str, level: int, compress_type: int = zipfile.ZIP_DEFLATED):
+    """Read and deflate a single file, returning (crc, size, compressed bytes)
+
+    With ZIP_STORED the data is returned as read, only the CRC is computed.
+    """
+    if compress_type != zipfile.ZIP_DEFLATED:
+        return _read_stored_file(file_path)
+
+    buffer = _acquire_buffer()
+    view = memoryview(buffer)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    chunks = []
+    crc = 0
+    size = 0
+    try:
+        with open(file_path, 'rb', buffering=0) as src:
+            _advise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+            while True:
+                n = src.readinto(buffer)
+                if not n:
+                    break
+                data = view[:n]
+                crc = zlib.crc32(data, crc)
+                chunks.append(compressor.compress(data))
+                size += n
+            # Don't let the backup evict the running server's page cache
+            _advise(src.fileno(), "POSIX_FADV_DONTNEED")
+    finally:
+        view.release()
+        _BUFFER_POOL.put(buffer)
+
+    chunks.append(compressor.flush())
+    return crc, size, b"".join(chunks)
+
+
+def _stream_file_entry(zipf: zipfile.ZipFile, file_path: str, arcname: str, compress_type: int):
+    """Add a large file by streaming it into the archive through a pooled buffer"""
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = compress_type
+    zinfo._compresslevel = zipf.compresslevel
+    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+        _advise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+        _copy_stream(src, dst)
+        _advise(src.fileno(), "POSIX_FADV_DONTNEED")
+
+
+def _entry_writer(zipf: zipfile.ZipFile):
+    """Build the per-file writer for _add_directory_to_zip with the archive's internals bound once
+
+    The returned function appends a member whose data was already prepared by
+    _compress_file. Its header comes from the scandir stat, so the file is not
+    stat'ed again the way ZipInfo.from_file would.
+    """
+    write = zipf.fp.write
+    tell = zipf.fp.tell
+    append_info = zipf.filelist.append
+    name_to_info = zipf.NameToInfo
+    make_info = zipfile.ZipInfo
+    localtime = time.localtime
+
+    def write_entry(arcname: str, st, result, compress_type: int):
+        crc, size, compressed = result
+        zinfo = make_info(arcname, localtime(st.st_mtime)[:6])
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        zinfo.compress_type = compress_type
+        zinfo.CRC = crc
+        zinfo.file_size = size
+        zinfo.compress_size = len(compressed)
+        zinfo.header_offset = tell()
+
+        write(zinfo.FileHeader())
+        write(compressed)
+        zipf.start_dir = tell()
+        append_info(zinfo)
+        name_to_info[arcname] = zinfo
+
+    return write_entry
+
+
+def _backup_fingerprint(backup_path: Path) -> bytes:
+    """Digest of an archive's contents built from the central directory only
+
+    Each member's name, CRC and size are already stored in the archive, so two
+    backups of an identical world produce the same digest without reading any
+    file data. Members are sorted first because the order they are written in
+    varies between runs.
+    """
+    with zipfile.ZipFile(backup_path, 'r') as zip_file:
+        members = sorted(
+            (info.filename, info.CRC, info.file_size) for info in zip_file.infolist()
+            if info.filename != MANIFEST_NAME  # Holds mtimes, which differ even when the contents do not
+        )
+
+    digest = hashlib.blake2b(digest_size=16)
+    for name, crc, size in members:
+        digest.update(f"{name}\0{crc}\0{size}\n".encode())
+    return digest.digest()
+
+
+def _walk_tree(root, prefix: str = ""):
+    """Yield (path, arcname, DirEntry) for everything under root, depth-first in name order
+
+    Uses os.scandir so file types come from the directory listing rather than
+    a stat per entry. Symlinked directories are listed but not descended into.
+    A directory that disappears while the server is running is skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except FileNotFoundError:
+        return
+
+    for entry in entries:
+        arcname = prefix + entry.name
+        yield entry.path, arcname, entry
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_tree(entry.path, arcname + "/")
+
+
+def _kernel_copy(src: str, dst: str):
+    """Copy a file with os.copy_file_range so the data never passes through userspace"""
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as e:
+        # Older kernels and some filesystems refuse cross-device copy_file_range
+        if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+            raise
+        return shutil.copy2(src, dst)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _move_tree(src: Path, dst: Path):
+    """Rename a directory, copying in-kernel and deleting the source when crossing filesystems"""
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copytree(src, dst, symlinks=True, copy_function=_kernel_copy)
+        shutil.rmtree(src)
+
+
+def _unused_path(path: Path) -> Path:
+    """path itself if nothing exists there, otherwise path with the first free _N suffix"""
+    candidate = path
+    counter = 1
+    while candidate.exists():
+        candidate = path.with_name(f"{path.name}_{counter}")
+        counter += 1
+    return candidate
+
+
+def _file_size(path: Path) -> int:
+    """Size of a file from a single stat call, or 0 if it does not exist"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _load_manifest(zip_file: zipfile.ZipFile) -> Dict[str, list]:
+    """Read the arcname -> [mtime_ns, size] manifest stored by an incremental backup"""
+    try:
+        manifest = json.loads(zip_file.read(MANIFEST_NAME))
+        return manifest if isinstance(manifest, dict) else {}
+    except (KeyError, ValueError, zipfile.BadZipFile):
+        return {}
+
+
+def _find_level_dat(names):
+    """Name of the world's level.dat: at the archive root, or inside a top-level folder"""
+    if "level.dat" in names:
+        return "level.dat"
+    return next((name for name in names if name.endswith("/level.dat")), None)
+
+
+def _has_level_dat(names) -> bool:
+    """Check whether the archive contains a level.dat"""
+    return _find_level_dat(names) is not None
+
+
+def _iter_tar_zst(backup_path: Path):
+    """Stream (tar, member) pairs from a .tar.zst archive in a single pass
+
+    The zstd frame carries a content checksum, so reading the stream to the
+    end also verifies the data.
+    """
+    with open(backup_path, 'rb') as raw:
+        with zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+            with tarfile.open(fileobj=reader, mode='r|') as tar:
+                for member in tar:
+                    yield tar, member
+
+
+def _scan_tar_zst(backup_path: Path) -> Dict[str, Any]:
+    """Read a whole .tar.zst archive, returning its member names and total size"""
+    names = set()
+    total_size = 0
+    for _, member in _iter_tar_zst(backup_path):
+        names.add(member.name)
+        total_size += member.size
+    return {"names": names, "uncompressed_size": total_size}
+
+
+def _seek_member_data(raw, info: zipfile.ZipInfo) -> bool:
+    """Position raw at the start of a member's compressed data, past its local header"""
+    raw.seek(info.header_offset)
+    header = raw.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        return False
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    raw.seek(name_length + extra_length, os.SEEK_CUR)
+    return True
+
+
+def _copy_raw_entry(zipf: zipfile.ZipFile, source: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """Copy a member's compressed bytes from another archive without inflating them"""
+    if not _seek_member_data(source.fp, info):
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    zinfo.CRC = info.CRC
+    zinfo.file_size = info.file_size
+    zinfo.compress_size = info.compress_size
+    zinfo.header_offset = zipf.fp.tell()
+    zipf.fp.write(zinfo.FileHeader())
+
+    buffer = _acquire_buffer()
+    view = memoryview(buffer)
+    remaining = info.compress_size
+    try:
+        while remaining > 0:
+            n = source.fp.readinto(view[:min(remaining, COPY_BUFFER_SIZE)])
+            if not n:
+                raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+            zipf.fp.write(view[:n])
+            remaining -= n
+    finally:
+        view.release()
+        _BUFFER_POOL.put(buffer)
+
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _entry_crc_ok(raw, info: zipfile.ZipInfo) -> bool:
+    """Stream one stored/deflated member and compare its CRC32 with the central directory"""
+    if not _seek_member_data(raw, info):
+        return False
+
+    decompressor = zlib.decompressobj(-15) if info.compress_type == zipfile.ZIP_DEFLATED else None
+    crc = 0
+    size = 0
+    remaining = info.compress_size
+
+    while remaining > 0:
+        chunk = raw.read(min(VERIFY_CHUNK_SIZE, remaining))
+        if not chunk:
+            return False
+        remaining -= len(chunk)
+
+        if decompressor is None:
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            continue
+
+        # Bound the inflated size per step so highly compressible data stays small in memory
+        data = decompressor.decompress(chunk, VERIFY_CHUNK_SIZE)
+        while data:
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+            data = decompressor.decompress(decompressor.unconsumed_tail, VERIFY_CHUNK_SIZE)
+
+    if decompressor is not None:
+        data = decompressor.flush()
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+
+    return crc == info.CRC and size == info.file_size
+
+
+def _check_archive_crcs(backup_path: Path, zip_file: zipfile.ZipFile) -> bool:
+    """Verify every member's CRC32 by streaming the raw archive data in large chunks"""
+    with open(backup_path, 'rb') as raw:
+        for info in zip_file.infolist():
+            if info.is_dir():
+                continue
+
+            if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                # Encrypted or unusual members - let zipfile check them (raises on bad CRC)
+                with zip_file.open(info) as member:
+                    while member.read(VERIFY_CHUNK_SIZE):
+                        pass
+                continue
+
+            if not _entry_crc_ok(raw, info):
+                return False
+
+    return True
+
 
 class BackupManager:
     """Enhanced backup management with compression and verification"""
@@ -23,34 +480,107 @@ class BackupManager:
     def __init__(self, config: ConfigManager):
         self.config = config
         self.backup_dir = Path(config.get("backup_dir"))
+        self.compresslevel = config.get("backup_compresslevel")
+        self._default_world_path = Path(config.get("server_dir")) / "world"
         self.auto_backup_thread = None
-        self.auto_backup_running = False
+        self._stop_event = threading.Event()
         self.backup_lock = threading.Lock()
+        self._log_queue = queue.Queue()
+        self._log_writer = None
+        self._log_lock = threading.Lock()
+        self._pre_backup = None
+        self._post_backup = None
+        self._verify_cache = {}
+        self._meta_cache = {}
+        self._archive_cache = {}
+        self._backup_dir_ready = False
         self._ensure_backup_dir()
+        self._index_lock = threading.Lock()
+        self._verified_index = self._load_verified_index()
 
     def _ensure_backup_dir(self):
-        """Ensure backup directory exists"""
+        """Ensure backup directory exists (only touches the filesystem until it has once)"""
+        if self._backup_dir_ready:
+            return
         try:
             self.backup_dir.mkdir(parents=True, exist_ok=True)
+            self._backup_dir_ready = True
         except Exception as e:
             console.print(f"[red]❌ Could not create backup directory: {e}[/red]")
 
-    def create_backup(self, name: str = None, world_dir: Path = None) -> bool:
-        """Create a backup of the world"""
-        with self.backup_lock:
-            if not world_dir:
-                world_dir = Path(self.config.get("server_dir")) / "world"
+    def _open_archive_tmp(self, tmp_path: Path, buffering: int = -1):
+        """Open a new archive for writing, recreating the backup directory if it was removed"""
+        try:
+            return open(tmp_path, 'wb', buffering=buffering)
+        except FileNotFoundError:
+            self._backup_dir_ready = False
+            self._ensure_backup_dir()
+            return open(tmp_path, 'wb', buffering=buffering)
+
+    def _load_verified_index(self) -> Dict[str, list]:
+        """Load the record of archives that already passed a deep check"""
+        try:
+            with open(self.backup_dir / BACKUP_INDEX_FILE) as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_verified_index(self):
+        """Persist the verified-archive index, ignoring write failures
+
+        Serialized with a lock because cleanup verifies archives concurrently.
+        """
+        with self._index_lock:
+            try:
+                with open(self.backup_dir / BACKUP_INDEX_FILE, 'w') as f:
+                    json.dump(dict(self._verified_index), f)
+            except OSError:
+                pass
+
+    def set_backup_hooks(self, pre_backup=None, post_backup=None):
+        """Register callables run before and after each backup (e.g. save-off / save-on)"""
+        self._pre_backup = pre_backup
+        self._post_backup = post_backup
+
+    def _run_backup_hook(self, hook):
+        """Run a backup hook; a failing hook must not stop the backup"""
+        if hook:
+            try:
+                hook()
+            except Exception as e:
+                console.print(f"[yellow]⚠️  Backup hook failed: {e}[/yellow]")
 
+    def create_backup(self, name: str = None, world_dir: Path = None, compresslevel=None) -> bool:
+        """Create a backup of the world
+
+        compresslevel may be a zlib level (0-9) or a tier name from
+        COMPRESSION_TIERS; it defaults to the configured level.
+        """
+        level = self._resolve_compresslevel(compresslevel)
+        prefix = self._sanitize_backup_name(name or 'world')
+        return self._execute_backup(prefix, world_dir or self._default_world_path, level)
+
+    def _auto_backup_fast(self) -> bool:
+        """Scheduled backup: constant name and level, cached world path"""
+        return self._execute_backup("auto", self._default_world_path, COMPRESSION_TIERS["fast"])
+
+    def _execute_backup(self, prefix: str, world_dir: Path, level: int) -> bool:
+        """Archive world_dir as <prefix>_<timestamp>.<ext>; prefix must already be sanitized"""
+        with self.backup_lock:
             if not world_dir.exists():
                 console.print(f"[red]❌ World directory not found: {world_dir}[/red]")
                 return False
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"{name or 'world'}_{timestamp}"
-            backup_path = self.backup_dir / f"{backup_name}.zip"
+            backup_name = f"{prefix}_{timestamp}"
+            extension = self._backup_extension()
+            backup_path = self.backup_dir / f"{backup_name}{extension}"
 
             try:
                 self._ensure_backup_dir()
+                self._remove_stale_tmp_files()
+                self._run_backup_hook(self._pre_backup)
 
                 with Progress(
                         SpinnerColumn(),
@@ -60,11 +590,18 @@ class BackupManager:
                     task = progress.add_task(f"Creating backup {backup_name}...", total=None)
 
                     # Create backup
-                    shutil.make_archive(str(self.backup_dir / backup_name), 'zip', world_dir)
+                    if extension == TAR_ZST_EXTENSION:
+                        self._create_tar_zst_archive(world_dir, backup_path)
+                    else:
+                        self._create_backup_archive(world_dir, backup_path, level)
 
                     # Verify backup
-                    if backup_path.exists() and backup_path.stat().st_size > 0:
-                        size_mb = backup_path.stat().st_size / 1024 / 1024
+                    # A same-second backup may have replaced an archive of this name
+                    self._forget_backup(backup_path.name)
+
+                    size = _file_size(backup_path)
+                    if size > 0:
+                        size_mb = size / 1024 / 1024
                         console.print(f"[green]✅ Backup created: {backup_path.name} ({size_mb:.1f} MB)[/green]")
 
                         # Log backup details
@@ -78,34 +615,262 @@ class BackupManager:
                         return False
 
             except Exception as e:
+                if isinstance(e, FileNotFoundError):
+                    self._backup_dir_ready = False  # Directory was removed; recreate next time
                 console.print(f"[red]❌ Backup failed: {e}[/red]")
                 return False
+            finally:
+                self._run_backup_hook(self._post_backup)
+
+    def _remove_stale_tmp_files(self):
+        """Delete temporary archives left behind by a backup that was killed; call under backup_lock"""
+        cutoff = time.time() - STALE_TMP_AGE
+        with os.scandir(self.backup_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(TMP_EXTENSIONS):
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        console.print(f"[dim]🗑️  Removed unfinished backup: {entry.name}[/dim]")
+                except OSError:
+                    pass
+
+    def _resolve_compresslevel(self, compresslevel=None) -> int:
+        """Turn a tier name or level into a zlib compression level"""
+        if compresslevel is None:
+            compresslevel = self.compresslevel
+        if isinstance(compresslevel, str):
+            compresslevel = COMPRESSION_TIERS.get(compresslevel.lower(), COMPRESSION_TIERS["balanced"])
+        return max(0, min(9, int(compresslevel)))
+
+    @staticmethod
+    def _sanitize_backup_name(name: str) -> str:
+        """Make a user-supplied backup name safe to use in a file name"""
+        return name.translate(_NAME_TRANSLATION)[:MAX_BACKUP_NAME_LENGTH].strip() or "backup"
+
+    def _backup_extension(self) -> str:
+        """File extension for new backups, from the backup_format setting"""
+        if self.config.get("backup_format") != "tar.zst":
+            return BACKUP_FILE_EXTENSION
+        if zstandard is None:
+            console.print("[yellow]⚠️  zstandard is not installed, falling back to zip backups[/yellow]")
+            return BACKUP_FILE_EXTENSION
+        return TAR_ZST_EXTENSION
+
+    def _create_tar_zst_archive(self, world_dir: Path, backup_path: Path):
+        """Write the world directory as a zstd-compressed tar, using zstd's own worker threads"""
+        tmp_path = backup_path.with_suffix(backup_path.suffix + ".tmp")
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1, write_checksum=True)
+        try:
+            with self._open_archive_tmp(tmp_path) as raw:
+                with compressor.stream_writer(raw, closefd=False) as writer:
+                    with tarfile.open(fileobj=writer, mode='w|') as tar:
+                        for file_path, arcname, entry in _walk_tree(world_dir):
+                            # Like make_archive, only directories and regular files
+                            if not (entry.is_dir() or entry.is_file()):
+                                continue
+                            try:
+                                tar.add(file_path, arcname, recursive=False)
+                            except FileNotFoundError:
+                                continue  # Removed by the server since the directory scan
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(tmp_path, backup_path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+    def _create_backup_archive(self, world_dir: Path, backup_path: Path, level: int):
+        """Write the world directory into a zip archive and flush it to disk
+
+        The archive is built under a .tmp name and renamed into place once
+        complete, so a crash never leaves a partial backup behind. With
+        incremental_backup enabled, files unchanged since the newest backup
+        are copied from it without being re-read or re-compressed.
+        """
+        incremental = self.config.get("incremental_backup")
+        manifest = {} if incremental else None
+        previous = self._open_previous_backup() if incremental else None
+
+        tmp_path = backup_path.with_suffix(backup_path.suffix + ".tmp")
+        try:
+            with self._open_archive_tmp(tmp_path, buffering=0) as raw:
+                with io.BufferedWriter(raw, buffer_size=ARCHIVE_WRITE_BUFFER) as buffered:
+                    compression = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+                    with zipfile.ZipFile(buffered, 'w', compression, compresslevel=level) as zipf:
+                        self._add_directory_to_zip(zipf, world_dir, level, self._backup_workers(),
+                                                   manifest, previous)
+                    buffered.flush()
+                    os.fsync(raw.fileno())
+            os.replace(tmp_path, backup_path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        finally:
+            if previous is not None:
+                previous.close()
+
+    def _open_previous_backup(self):
+        """Open the newest zip backup if it carries a manifest, for incremental backups"""
+        try:
+            for backup_path, _ in self._get_sorted_backups():
+                if not backup_path.name.endswith(BACKUP_FILE_EXTENSION):
+                    continue
+                zip_file = zipfile.ZipFile(backup_path, 'r')
+                if MANIFEST_NAME in zip_file.NameToInfo:
+                    return zip_file
+                zip_file.close()
+                break
+        except (OSError, zipfile.BadZipFile):
+            pass
+        return None
+
+    def _backup_workers(self) -> int:
+        """Number of compression threads, one per core unless parallel_backup is off"""
+        if not self.config.get("parallel_backup"):
+            return 1
+        return os.cpu_count() or 1
+
+    @staticmethod
+    def _add_directory_to_zip(zipf: zipfile.ZipFile, dir_path: Path, level: int, workers: int = 1,
+                              manifest: Dict[str, list] = None, previous: zipfile.ZipFile = None):
+        """Add everything under dir_path to the archive, relative to dir_path
+
+        Files are deflated on a pool of `workers` threads (zlib releases the
+        GIL) while this thread writes the results in submission order. Directory
+        entries, streamed large files and raw copies are written as they are
+        reached, so member order is not strictly the walk order. At most a
+        couple of files per worker, and no more than MAX_INFLIGHT_BYTES of
+        file data, are held in memory at once. Level 0 stores every file
+        without compression.
+
+        As with shutil.make_archive, only directories and regular files are
+        archived (dangling symlinks, FIFOs and sockets are skipped), and a file
+        that disappears before it is read is left out rather than failing
+        the backup.
+
+        When manifest is a dict it is filled with arcname -> [mtime_ns, size]
+        and stored as MANIFEST_NAME. Files whose manifest entry in `previous`
+        still matches are copied from it raw instead of being compressed.
+        """
+        previous_manifest = _load_manifest(previous) if previous is not None else {}
+        default_type = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+        stored, stored_exts = zipfile.ZIP_STORED, _STORED_EXTS
+        splitext = os.path.splitext
+        write_entry = _entry_writer(zipf)
+        window = workers * 2
+        in_flight = 0
+        pending = deque()
+        push, pop = pending.append, pending.popleft
+
+        def write_pending(item):
+            name, st, ctype, future = item
+            try:
+                result = future.result()
+            except FileNotFoundError:
+                if manifest is not None:
+                    manifest.pop(name, None)
+                return
+            write_entry(name, st, result, ctype)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            submit = pool.submit
+            for file_path, arcname, entry in _walk_tree(dir_path):
+                if entry.is_dir():
+                    zipf.write(file_path, arcname)
+                    continue
+                if not entry.is_file():
+                    continue
+                compress_type = stored if splitext(entry.name)[1].lower() in stored_exts else default_type
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if manifest is not None:
+                    signature = [st.st_mtime_ns, st.st_size]
+                    manifest[arcname] = signature
+                    if previous_manifest.get(arcname) == signature and arcname in previous.NameToInfo:
+                        _copy_raw_entry(zipf, previous, previous.NameToInfo[arcname])
+                        continue
+                if st.st_size > STREAM_THRESHOLD:
+                    try:
+                        _stream_file_entry(zipf, file_path, arcname, compress_type)
+                    except FileNotFoundError:
+                        if manifest is not None:
+                            manifest.pop(arcname, None)
+                    continue
+
+                push((arcname, st, compress_type, submit(_compress_file, file_path, level, compress_type)))
+                in_flight += st.st_size
+                while pending and (len(pending) >= window or in_flight > MAX_INFLIGHT_BYTES):
+                    item = pop()
+                    in_flight -= item[1].st_size
+                    write_pending(item)
+
+            while pending:
+                write_pending(pop())
+
+        if manifest is not None:
+            zipf.writestr(MANIFEST_NAME, json.dumps(manifest))
+
+    def _log_line(self, message: str):
+        """Queue a timestamped line for the background log writer"""
+        self._log_queue.put(f"{datetime.now().isoformat()} - {message}\n")
+        if self._log_writer is None:
+            with self._log_lock:
+                if self._log_writer is None:
+                    self._log_writer = threading.Thread(
+                        target=self._log_writer_loop, daemon=True, name="backup-log-writer")
+                    self._log_writer.start()
+                    atexit.register(self._flush_logs)
+
+    def _log_writer_loop(self):
+        """Write queued log lines in batches through one append handle"""
+        log_fp = None
+        while True:
+            batch = [self._log_queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                if log_fp is None:
+                    log_fp = open(self.backup_dir / BACKUP_LOG_NAME, 'a', encoding='utf-8')
+                log_fp.write("".join(batch))
+                log_fp.flush()
+            except Exception:
+                log_fp = None  # Logging failure shouldn't break backup; reopen next time
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+
+    def _flush_logs(self):
+        """Block until every queued log line has been written"""
+        if self._log_writer is not None:
+            self._log_queue.join()
 
     def _log_backup(self, backup_path: Path, size_mb: float):
         """Log backup creation details"""
-        log_file = self.backup_dir / "backup.log"
-        try:
-            with open(log_file, 'a') as f:
-                f.write(f"{datetime.now().isoformat()} - Created {backup_path.name} ({size_mb:.1f} MB)\n")
-        except Exception:
-            pass  # Logging failure shouldn't break backup
+        self._log_line(f"Created {backup_path.name} ({size_mb:.1f} MB)")
 
     def _cleanup_old_backups(self):
         """Remove old backups based on configuration"""
         try:
-            backups = sorted(
-                self.backup_dir.glob("*.zip"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+            backups = self._get_sorted_backups()
 
             max_backups = self.config.get("max_backups")
             if len(backups) > max_backups:
                 removed_count = 0
-                for old_backup in backups[max_backups:]:
+                for old_backup, stat in backups[max_backups:]:
                     try:
-                        size_mb = old_backup.stat().st_size / 1024 / 1024
+                        size_mb = stat.st_size / 1024 / 1024
                         old_backup.unlink()
+                        self._forget_backup(old_backup.name)
                         console.print(f"[yellow]🗑️  Removed old backup: {old_backup.name} ({size_mb:.1f} MB)[/yellow]")
                         removed_count += 1
 
@@ -123,34 +888,78 @@ class BackupManager:
 
     def _log_cleanup(self, backup_name: str, size_mb: float):
         """Log backup cleanup"""
-        log_file = self.backup_dir / "backup.log"
-        try:
-            with open(log_file, 'a') as f:
-                f.write(f"{datetime.now().isoformat()} - Removed {backup_name} ({size_mb:.1f} MB)\n")
-        except Exception:
-            pass
+        self._log_line(f"Removed {backup_name} ({size_mb:.1f} MB)")
 
     def list_backups(self) -> List[Dict[str, Any]]:
         """List all available backups"""
         backups = []
-        if not self.backup_dir.exists():
-            return backups
+        now = time.time()
 
         try:
-            for backup_file in sorted(self.backup_dir.glob("*.zip"), key=lambda x: x.stat().st_mtime, reverse=True):
-                stat = backup_file.stat()
+            for backup_file, stat in self._get_sorted_backups():
+                info = self._get_backup_file_info(backup_file, stat)
                 backups.append({
-                    "name": backup_file.name,
-                    "path": backup_file,
-                    "size_mb": stat.st_size / 1024 / 1024,
-                    "created": datetime.fromtimestamp(stat.st_mtime),
-                    "age_hours": (datetime.now().timestamp() - stat.st_mtime) / 3600
+                    **info,
+                    "age_hours": (now - stat.st_mtime) / 3600
                 })
+        except FileNotFoundError:
+            self._backup_dir_ready = False  # No backup directory (yet)
         except Exception as e:
             console.print(f"[red]❌ Error listing backups: {e}[/red]")
 
         return backups
 
+    def _get_sorted_backups(self) -> List[tuple]:
+        """Get (path, stat) for every backup archive, newest first, in one directory scan"""
+        with os.scandir(self.backup_dir) as it:
+            entries = [(entry.name, entry.stat()) for entry in it
+                       if entry.name.endswith(BACKUP_EXTENSIONS) and entry.is_file()]
+
+        entries.sort(key=lambda e: e[1].st_mtime, reverse=True)
+        return [(self.backup_dir / name, stat) for name, stat in entries]
+
+    def _get_backup_file_info(self, backup_file: Path, stat) -> Dict[str, Any]:
+        """Get listing metadata for a backup, reusing it while the file is unchanged
+
+        Only stat-derived fields; the archive itself is not opened.
+        """
+        info = self._cache_get(self._meta_cache, backup_file.name, stat)
+        if info is None:
+            info = {
+                "name": backup_file.name,
+                "path": backup_file,
+                "size_mb": stat.st_size / 1024 / 1024,
+                "created": datetime.fromtimestamp(stat.st_mtime)
+            }
+            self._cache_put(self._meta_cache, backup_file.name, stat, info)
+        return info
+
+    @staticmethod
+    def _cache_get(cache: Dict[str, tuple], name: str, stat):
+        """Return a cached value if the file's mtime and size still match"""
+        entry = cache.get(name)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        return None
+
+    @staticmethod
+    def _cache_put(cache: Dict[str, tuple], name: str, stat, value):
+        """Store a value keyed by file name, evicting the oldest entry when full"""
+        cache.pop(name, None)
+        if len(cache) >= META_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[name] = (stat.st_mtime_ns, stat.st_size, value)
+
+    def _forget_backup(self, backup_name: str):
+        """Drop cached metadata for a removed or replaced backup"""
+        self._meta_cache.pop(backup_name, None)
+        self._archive_cache.pop(backup_name, None)
+        # Snapshot the keys: other threads may be adding verification results
+        for key in [k for k in list(self._verify_cache) if k[0] == backup_name]:
+            self._verify_cache.pop(key, None)
+        if self._verified_index.pop(backup_name, None) is not None:
+            self._save_verified_index()
+
     def restore_backup(self, backup_name: str, server_dir: Path) -> bool:
         """Restore a backup"""
         backup_path = self.backup_dir / backup_name
@@ -163,18 +972,20 @@ class BackupManager:
         try:
             # Backup current world before restore
             if world_dir.exists():
-                backup_current = server_dir / f"world_backup_before_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                shutil.move(str(world_dir), str(backup_current))
+                backup_current = _unused_path(
+                    server_dir / f"world_backup_before_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+                _move_tree(world_dir, backup_current)
                 console.print(f"[yellow]💾 Current world backed up to: {backup_current.name}[/yellow]")
 
             # Extract backup
             with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
+                    MofNCompleteColumn(),
                     console=console
             ) as progress:
                 task = progress.add_task(f"Restoring {backup_name}...", total=None)
-                shutil.unpack_archive(str(backup_path), str(server_dir))
+                self._extract_backup_archive(backup_path, server_dir, progress, task)
 
             # Verify restore
             if world_dir.exists():
@@ -191,74 +1002,223 @@ class BackupManager:
             console.print(f"[red]❌ Restore failed: {e}[/red]")
             return False
 
+    @classmethod
+    def _extract_backup_archive(cls, backup_path: Path, server_dir: Path, progress: Progress, task):
+        """Extract a backup of either format into the server's world directory"""
+        if backup_path.name.endswith(TAR_ZST_EXTENSION):
+            cls._extract_tar_zst_archive(backup_path, server_dir / "world", progress, task)
+        else:
+            cls._extract_zip_archive(backup_path, server_dir, progress, task)
+
+    @staticmethod
+    def _extract_tar_zst_archive(backup_path: Path, world_dir: Path, progress: Progress, task):
+        """Stream regular files and directories out of a .tar.zst backup"""
+        root = world_dir.resolve()
+        root.mkdir(parents=True, exist_ok=True)
+
+        for tar, member in _iter_tar_zst(backup_path):
+            target = (root / member.name).resolve()
+            if target != root and root not in target.parents:
+                raise ValueError(f"Unsafe path in archive: {member.name}")
+
+            if member.isdir():
+                target.mkdir(parents=True, exist_ok=True)
+            elif member.isfile():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with tar.extractfile(member) as src, open(target, 'wb') as dst:
+                    _copy_stream(src, dst)
+            progress.advance(task)
+
+    @staticmethod
+    def _extract_zip_archive(backup_path: Path, server_dir: Path, progress: Progress, task):
+        """Stream every member to disk through a pooled buffer, advancing progress per entry
+
+        Archives made by create_backup are rooted at the world directory, so
+        they are extracted into server_dir/world. Archives that carry a
+        top-level world/ folder instead are extracted into server_dir.
+        """
+        with zipfile.ZipFile(backup_path, 'r') as zipf:
+            if "level.dat" not in zipf.NameToInfo and "world/level.dat" in zipf.NameToInfo:
+                target_root = server_dir
+            else:
+                target_root = server_dir / "world"
+
+            root = target_root.resolve()
+            infos = zipf.infolist()
+            progress.update(task, total=len(infos))
+
+            for info in infos:
+                if info.filename == MANIFEST_NAME:
+                    progress.advance(task)
+                    continue
+                target = (root / info.filename).resolve()
+                if target != root and root not in target.parents:
+                    raise ValueError(f"Unsafe path in archive: {info.filename}")
+
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with zipf.open(info) as src, open(target, 'wb') as dst:
+                        _copy_stream(src, dst)
+                progress.advance(task)
+
     def _log_restore(self, backup_name: str):
         """Log backup restore"""
-        log_file = self.backup_dir / "backup.log"
-        try:
-            with open(log_file, 'a') as f:
-                f.write(f"{datetime.now().isoformat()} - Restored {backup_name}\n")
-        except Exception:
-            pass
-
-    def verify_backup(self, backup_name: str) -> bool:
-        """Verify backup integrity"""
+        self._log_line(f"Restored {backup_name}")
+
+    def verify_backup(self, backup_name: str, deep: bool = False) -> Optional[bool]:
+        """Verify backup integrity
+
+        The default check parses the central directory and reads level.dat,
+        which checks that one entry's CRC. deep=True (see deep_verify_backup)
+        streams every member and checks its CRC.
+        Results are cached per (mtime, size) so unchanged archives are not
+        re-read within a session. Returns None when the archive could not be
+        checked (e.g. a .tar.zst backup without the zstandard package).
+        """
         backup_path = self.backup_dir / backup_name
-        if not backup_path.exists():
+        try:
+            stat = backup_path.stat()
+        except OSError:
             return False
-
+        return self._verify_backup_stat(backup_path, stat, deep)
+
+    def deep_verify_backup(self, backup_name: str) -> Optional[bool]:
+        """Check the CRC of every member, not just level.dat"""
+        return self.verify_backup(backup_name, deep=True)
+
+    def _verify_backup_stat(self, backup_path: Path, stat, deep: bool = False) -> Optional[bool]:
+        """verify_backup for callers that already hold the archive's stat from a directory scan"""
+        backup_name = backup_path.name
+        cache_key = (backup_name, stat.st_mtime_ns, stat.st_size, deep)
+        cached = self._verify_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if deep and self._verified_index.get(backup_name) == [stat.st_mtime_ns, stat.st_size]:
+            self._verify_cache[cache_key] = True
+            return True
+
+        if deep:
+            valid = self._perform_deep_verification(backup_path)
+        else:
+            meta = self._archive_meta(backup_path, stat)
+            valid = meta["valid"] and meta["contains_level_dat"]
+        if valid is None:
+            return None  # Could not be checked; try again next time
+        self._verify_cache[cache_key] = valid
+        if deep and valid:
+            self._verified_index[backup_name] = [stat.st_mtime_ns, stat.st_size]
+            self._save_verified_index()
+        return valid
+
+    @staticmethod
+    def _perform_deep_verification(backup_path: Path) -> Optional[bool]:
+        """Check the archive for world data and the CRC of every member
+
+        Returns None if the archive can't be checked here, e.g. because it
+        could not be read.
+        """
         try:
-            import zipfile
-            with zipfile.ZipFile(backup_path, 'r') as zip_file:
-                # Test the zip file
-                zip_file.testzip()
+            if backup_path.name.endswith(TAR_ZST_EXTENSION):
+                if zstandard is None:
+                    return None
+                # Reading the whole stream already checks the zstd checksum
+                return _has_level_dat(_scan_tar_zst(backup_path)["names"])
 
-                # Check if it contains world data
-                file_list = zip_file.namelist()
-                has_world_data = any('level.dat' in f for f in file_list)
+            with zipfile.ZipFile(backup_path, 'r') as zip_file:
+                if not _has_level_dat(zip_file.NameToInfo):
+                    return False
+                return _check_archive_crcs(backup_path, zip_file)
 
-                return has_world_data
+        except _CORRUPTION_ERRORS:
+            return False
+        except Exception:
+            return None
+
+    def _archive_meta(self, backup_path: Path, stat) -> Dict[str, Any]:
+        """Content summary shared by verify_backup and get_backup_info, parsed once per file version"""
+        meta = self._cache_get(self._archive_cache, backup_path.name, stat)
+        if meta is None:
+            meta = self._read_zip_meta(backup_path)
+            if meta["valid"] is not None:
+                self._cache_put(self._archive_cache, backup_path.name, stat, meta)
+        return meta
+
+    @staticmethod
+    def _read_zip_meta(backup_path: Path) -> Dict[str, Any]:
+        """Open a backup once for its member count, sizes, level.dat presence and validity
+
+        For zip archives only the central directory and level.dat are read;
+        reading level.dat checks its CRC. A .tar.zst archive has no index, so
+        it is read in full and checked against its zstd checksum. "valid" is
+        None when the archive can't be read here (zstandard not installed, or
+        an I/O error).
+        """
+        try:
+            if backup_path.name.endswith(TAR_ZST_EXTENSION):
+                if zstandard is None:
+                    return {"valid": None, "file_count": 0, "contains_level_dat": False,
+                            "uncompressed_size_mb": 0}
+                contents = _scan_tar_zst(backup_path)
+                return {
+                    "valid": True,
+                    "file_count": len(contents["names"]),
+                    "contains_level_dat": _has_level_dat(contents["names"]),
+                    "uncompressed_size_mb": contents["uncompressed_size"] / 1024 / 1024
+                }
 
+            with zipfile.ZipFile(backup_path, 'r') as zip_file:
+                infos = zip_file.infolist()
+                level_dat = _find_level_dat(zip_file.NameToInfo)
+                if level_dat is not None:
+                    zip_file.read(level_dat)
+                return {
+                    "valid": True,
+                    "file_count": len(infos),
+                    "contains_level_dat": level_dat is not None,
+                    "uncompressed_size_mb": sum(i.file_size for i in infos) / 1024 / 1024
+                }
+
+        except _CORRUPTION_ERRORS:
+            return {"valid": False, "file_count": 0, "contains_level_dat": False, "uncompressed_size_mb": 0}
         except Exception:
-            return False
+            return {"valid": None, "file_count": 0, "contains_level_dat": False, "uncompressed_size_mb": 0}
 
     def get_backup_info(self, backup_name: str) -> Dict[str, Any]:
         """Get detailed information about a backup"""
         backup_path = self.backup_dir / backup_name
-        if not backup_path.exists():
-            return {}
-
         try:
-            import zipfile
             stat = backup_path.stat()
+        except OSError:
+            return {}
 
-            info = {
-                "name": backup_name,
-                "path": str(backup_path),
-                "size_mb": stat.st_size / 1024 / 1024,
-                "created": datetime.fromtimestamp(stat.st_mtime),
-                "valid": False,
-                "file_count": 0,
-                "contains_level_dat": False
-            }
-
-            # Analyze zip contents
-            with zipfile.ZipFile(backup_path, 'r') as zip_file:
-                file_list = zip_file.namelist()
-                info["file_count"] = len(file_list)
-                info["contains_level_dat"] = any('level.dat' in f for f in file_list)
-                info["valid"] = True
+        meta = self._archive_meta(backup_path, stat)
+        if not meta["valid"]:
+            return {"name": backup_name, "valid": meta["valid"]}
 
-            return info
+        return {
+            "name": backup_name,
+            "path": str(backup_path),
+            "size_mb": stat.st_size / 1024 / 1024,
+            "created": datetime.fromtimestamp(stat.st_mtime),
+            **meta
+        }
 
-        except Exception:
-            return {"name": backup_name, "valid": False}
+    @property
+    def auto_backup_running(self) -> bool:
+        """Whether the auto-backup thread is active and has not been asked to stop"""
+        return (self.auto_backup_thread is not None
+                and self.auto_backup_thread.is_alive()
+                and not self._stop_event.is_set())
 
     def start_auto_backup(self):
         """Start automatic backup thread"""
         if not self.config.get("auto_backup") or self.auto_backup_running:
             return
 
-        self.auto_backup_running = True
+        self._stop_event.clear()
         self.auto_backup_thread = threading.Thread(target=self._auto_backup_loop, daemon=True)
         self.auto_backup_thread.start()
 
@@ -267,23 +1227,24 @@ class BackupManager:
 
     def stop_auto_backup(self):
         """Stop automatic backup thread"""
-        self.auto_backup_running = False
+        self._stop_event.set()
         if self.auto_backup_thread:
             self.auto_backup_thread.join(timeout=5)
+        self._flush_logs()
         console.print("[yellow]⏹️  Auto-backup stopped[/yellow]")
 
     def _auto_backup_loop(self):
         """Auto-backup loop"""
         interval = self.config.get("backup_interval")
 
-        while self.auto_backup_running:
-            time.sleep(interval)
-            if self.auto_backup_running:  # Check again after sleep
-                try:
-                    console.print("[cyan]🔄 Performing automatic backup...[/cyan]")
-                    self.create_backup("auto")
-                except Exception as e:
-                    console.print(f"[red]❌ Auto-backup failed: {e}[/red]")
+        # wait() returns True as soon as stop_auto_backup() sets the event
+        while not self._stop_event.wait(interval):
+            try:
+                console.print("[cyan]🔄 Performing automatic backup...[/cyan]")
+                # Auto-backups run next to a live server, so favour speed over size
+                self._auto_backup_fast()
+            except Exception as e:
+                console.print(f"[red]❌ Auto-backup failed: {e}[/red]")
 
     def get_backup_stats(self) -> Dict[str, Any]:
         """Get backup statistics"""
@@ -292,24 +1253,44 @@ class BackupManager:
         if not backups:
             return {
                 "total_backups": 0,
+                "valid_backups": 0,
                 "total_size_mb": 0,
                 "oldest": None,
                 "newest": None,
                 "average_size_mb": 0
             }
 
-        total_size = sum(b["size_mb"] for b in backups)
+        cfg_get = self.config.get
+        total_size = 0.0
+        valid = 0
+        oldest = newest = None
+        for backup in backups:
+            total_size += backup["size_mb"]
+            # Zip archives only: the quick check reads the central directory and
+            # level.dat, while a .tar.zst would have to be decompressed in full
+            path = backup["path"]
+            if path.name.endswith(BACKUP_FILE_EXTENSION):
+                try:
+                    valid += self._verify_backup_stat(path, path.stat()) is True
+                except OSError:
+                    pass
+            created = backup["created"]
+            if oldest is None or created < oldest:
+                oldest = created
+            if newest is None or created > newest:
+                newest = created
 
         return {
             "total_backups": len(backups),
+            "valid_backups": valid,
             "total_size_mb": total_size,
-            "oldest": min(backups, key=lambda x: x["created"])["created"],
-            "newest": max(backups, key=lambda x: x["created"])["created"],
+            "oldest": oldest,
+            "newest": newest,
             "average_size_mb": total_size / len(backups),
-            "auto_backup_enabled": self.config.get("auto_backup"),
+            "auto_backup_enabled": cfg_get("auto_backup"),
             "auto_backup_running": self.auto_backup_running,
-            "backup_interval_hours": self.config.get("backup_interval") / 3600,
-            "max_backups": self.config.get("max_backups")
+            "backup_interval_hours": cfg_get("backup_interval") / 3600,
+            "max_backups": cfg_get("max_backups")
         }
 
     def export_backup_logs(self, filename: str = None) -> str:
@@ -317,7 +1298,8 @@ class BackupManager:
         if not filename:
             filename = f"backup_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 
-        log_file = self.backup_dir / "backup.log"
+        log_file = self.backup_dir / BACKUP_LOG_NAME
+        self._flush_logs()
 
         try:
             if log_file.exists():
@@ -339,22 +1321,129 @@ class BackupManager:
             console.print(f"[red]❌ Failed to export logs: {e}[/red]")
             return ""
 
-    def cleanup_corrupted_backups(self) -> int:
-        """Remove corrupted or invalid backup files"""
-        removed_count = 0
+    def optimize_backups(self) -> Dict[str, Any]:
+        """Remove older backups whose contents are identical to a newer one"""
+        results = {"duplicates_removed": 0, "space_freed_mb": 0.0}
+
+        with self.backup_lock:
+            seen = {}
+            for backup_path, stat in self._get_sorted_backups():
+                try:
+                    fingerprint = _backup_fingerprint(backup_path)
+                except (OSError, zipfile.BadZipFile):
+                    continue  # Left for cleanup_corrupted_backups
+
+                newer = seen.setdefault(fingerprint, backup_path)
+                if newer is backup_path:
+                    continue
 
-        for backup_file in self.backup_dir.glob("*.zip"):
-            if not self.verify_backup(backup_file.name):
                 try:
-                    size_mb = backup_file.stat().st_size / 1024 / 1024
-                    backup_file.unlink()
-                    console.print(
-                        f"[yellow]🗑️  Removed corrupted backup: {backup_file.name} ({size_mb:.1f} MB)[/yellow]")
-                    removed_count += 1
+                    size_mb = stat.st_size / 1024 / 1024
+                    backup_path.unlink()
+                    self._forget_backup(backup_path.name)
+                    self._log_cleanup(backup_path.name, size_mb)
+                    console.print(f"[dim]🗑️  Removed duplicate: {backup_path.name} (same as {newer.name})[/dim]")
+                    results["duplicates_removed"] += 1
+                    results["space_freed_mb"] += size_mb
                 except Exception as e:
-                    console.print(f"[red]❌ Could not remove {backup_file.name}: {e}[/red]")
+                    console.print(f"[red]❌ Could not remove {backup_path.name}: {e}[/red]")
+
+        if results["duplicates_removed"]:
+            console.print(f"[cyan]🧹 Removed {results['duplicates_removed']} duplicate backup(s), "
+                          f"freed {results['space_freed_mb']:.1f} MB[/cyan]")
+        else:
+            console.print("[green]✅ No duplicate backups found[/green]")
+
+        return results
+
+    def start_startup_cleanup(self):
+        """Check existing backups on a background thread, if startup_backup_check is enabled"""
+        if not self.config.get("startup_backup_check"):
+            return
+        threading.Thread(
+            target=self._quarantine_corrupted_backups_on_startup,
+            daemon=True,
+            name="backup-startup-check"
+        ).start()
+
+    def _quarantine_corrupted_backups_on_startup(self):
+        """Background startup check; archives already in the verified index are skipped
+
+        Nothing is deleted here: archives that fail are renamed with
+        QUARANTINE_SUFFIX, which every backup scan ignores, and can be removed
+        by hand. Deletion is left to cleanup_corrupted_backups().
+
+        Archives are read one at a time so the running server keeps its CPU
+        and disk, and backup_lock is only taken around each rename so backups
+        are never held up by the scan.
+        """
+        try:
+            corrupted, unchecked = self._find_corrupted_backups(workers=1)
+            for backup_file, stat in corrupted:
+                quarantined = backup_file.with_name(backup_file.name + QUARANTINE_SUFFIX)
+                try:
+                    with self.backup_lock:
+                        # Skip archives replaced or removed since they were checked
+                        current = backup_file.stat()
+                        if (current.st_mtime_ns, current.st_size) != (stat.st_mtime_ns, stat.st_size):
+                            continue
+                        os.replace(backup_file, quarantined)
+                        self._forget_backup(backup_file.name)
+                    self._log_line(f"Quarantined corrupted backup {backup_file.name}")
+                    console.print(f"[yellow]⚠️  Corrupted backup moved aside: {quarantined.name}[/yellow]")
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    console.print(f"[red]❌ Could not quarantine {backup_file.name}: {e}[/red]")
+            if unchecked:
+                console.print(f"[yellow]⚠️  {unchecked} backup(s) could not be checked at startup[/yellow]")
+        except Exception as e:
+            console.print(f"[red]❌ Startup backup check failed: {e}[/red]")
+
+    def _find_corrupted_backups(self, workers: int = None):
+        """Deep-check every backup, returning ([(path, stat)] that failed, number that couldn't be checked)
+
+        Archives are independent, so they are checked on `workers` threads
+        (default: one per core).
+        """
+        backups = self._get_sorted_backups()
+
+        def check(backup):
+            return self._verify_backup_stat(backup[0], backup[1], deep=True)
+
+        if workers == 1:
+            results = [check(backup) for backup in backups]
+        else:
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+                results = list(pool.map(check, backups))
+
+        corrupted = [backup for backup, valid in zip(backups, results) if valid is False]
+        unchecked = sum(valid is None for valid in results)
+        return corrupted, unchecked
+
+    def cleanup_corrupted_backups(self) -> int:
+        """Remove corrupted or invalid backup files
+
+        Archives that could not be checked (unreadable, or a .tar.zst without
+        zstandard) are kept.
+        """
+        removed_count = 0
+        corrupted, unchecked = self._find_corrupted_backups()
+
+        for backup_file, stat in corrupted:
+            try:
+                size_mb = stat.st_size / 1024 / 1024
+                backup_file.unlink()
+                self._forget_backup(backup_file.name)
+                console.print(
+                    f"[yellow]🗑️  Removed corrupted backup: {backup_file.name} ({size_mb:.1f} MB)[/yellow]")
+                removed_count += 1
+            except Exception as e:
+                console.print(f"[red]❌ Could not remove {backup_file.name}: {e}[/red]")
 
         if removed_count > 0:
             console.print(f"[cyan]🧹 Removed {removed_count} corrupted backup(s)[/cyan]")
+        if unchecked:
+            console.print(f"[yellow]⚠️  Skipped {unchecked} backup(s) that could not be checked[/yellow]")
 
         return removed_count
@@ -2,20 +2,57 @@
 Configuration management for Craft Minecraft Server Manager
 """
 
+import functools
 import json
+import mmap
 import os
+import zlib
+from collections import ChainMap
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Dict
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm, IntPrompt
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-console = Console()
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
+_console = None
 
+# G1 tuning suggested for NeoForge (the JVM honours the last MaxGCPauseMillis, so list it once)
+NEOFORGE_JAVA_ARGS = ("-XX:+UseG1GC -XX:+UnlockExperimentalVMOptions -XX:G1NewSizePercent=20 "
+                      "-XX:G1ReservePercent=20 -XX:MaxGCPauseMillis=50 -XX:G1HeapRegionSize=32M")
+
+
+def _get_console():
+    """Create the rich console on first use so importing config stays cheap"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# Prefault the (small) config file in one go where the platform supports it
+if hasattr(mmap, 'MAP_POPULATE'):
+    _MMAP_KWARGS = {"flags": mmap.MAP_SHARED | mmap.MAP_POPULATE, "prot": mmap.PROT_READ}
+else:
+    _MMAP_KWARGS = {"access": mmap.ACCESS_READ}
+
+
+@functools.lru_cache(maxsize=None)
 def get_config_dir() -> Path:
-    """Get the appropriate configuration directory for the platform"""
+    """Get the appropriate configuration directory for the platform
+
+    Cached for the life of the process; call get_config_dir.cache_clear()
+    after changing APPDATA/XDG_CONFIG_HOME.
+    """
     if os.name == 'nt':  # Windows
         config_dir = Path(os.environ.get('APPDATA', Path.home())) / 'craft'
     else:  # Linux/macOS
@@ -29,20 +66,67 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+def _build_range_checker(ranges, defaults):
+    """Generate a straight-line checker for the fixed (key, lo, hi) range table
+
+    hi may be None for settings with only a lower bound. Returns the
+    (key, lo, hi) entries that were out of range and reset.
+    """
+    lines = ["def check_ranges(data):", "    reset = []"]
+    for key, lo, hi in ranges:
+        test = f"{lo!r} <= value" if hi is None else f"{lo!r} <= value <= {hi!r}"
+        lines += [
+            f"    value = data.get({key!r})",
+            f"    if value is not None and not ({test}):",
+            f"        data[{key!r}] = {defaults[key]!r}",
+            f"        reset.append(({key!r}, {lo!r}, {hi!r}))",
+        ]
+    lines.append("    return reset")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["check_ranges"]
+
+
+def _build_type_checker(defaults):
+    """Generate a straight-line check of every setting's type against its default
+
+    Returns the keys present in data whose value has the wrong type.
+    """
+    # Bind the type objects as defaults so each check is a local load, not a builtins lookup
+    type_names = sorted({type(value).__name__ for value in defaults.values()})
+    params = ", ".join(f"{name}={name}" for name in type_names)
+    lines = [f"def find_mismatches(data, {params}):", "    mismatched = []"]
+    for key, value in defaults.items():
+        lines += [
+            f"    if {key!r} in data and data[{key!r}].__class__ is not {type(value).__name__}:",
+            f"        mismatched.append({key!r})",
+        ]
+    lines.append("    return mismatched")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["find_mismatches"]
+
+
 class ConfigManager:
     """Enhanced configuration management with validation"""
 
-    DEFAULTS = {
+    # Read-only: saved values layer over this in a ChainMap
+    DEFAULTS = MappingProxyType({
         "server_dir": "server",
         "jar_name": "neoforge-server.jar",
         "memory_min": "2G",
         "memory_max": "4G",
-        "java_args": "-XX:+UseG1GC -XX:+UnlockExperimentalVMOptions -XX:MaxGCPauseMillis=100 -XX:G1NewSizePercent=20 -XX:G1ReservePercent=20 -XX:MaxGCPauseMillis=50 -XX:G1HeapRegionSize=32M",
+        "java_args": NEOFORGE_JAVA_ARGS,
         "backup_dir": "backups",
         "max_backups": 10,
         "auto_backup": True,
         "backup_interval": 3600,  # 1 hour
         "backup_on_stop": True,
+        "backup_compresslevel": 6,  # zlib level for manual backups, 0 = store (auto-backups use 1)
+        "parallel_backup": True,  # Compress files on all CPU cores
+        "backup_format": "zip",  # "zip" or "tar.zst" (needs the zstandard package)
+        "incremental_backup": False,  # Reuse unchanged files from the newest zip backup
+        "startup_backup_check": False,  # Deep-check backups when the watchdog starts, moving bad ones aside
         "watchdog_enabled": True,
         "watchdog_interval": 30,  # 30 seconds
         "restart_on_crash": True,
@@ -52,149 +136,379 @@ class ConfigManager:
         "console_history": 1000,
         "force_stop": True,  # Default to force stop for faster shutdown
         "stop_timeout": 10  # Reduced timeout before force stop
-    }
+    })
+
+    # Expected type of every setting, derived once from the defaults
+    _TYPE_MAP = {key: type(value) for key, value in DEFAULTS.items()}
+    _find_mismatches = staticmethod(_build_type_checker(DEFAULTS))
+
+    # Strings accepted as true when a boolean setting was saved as text
+    _TRUTHY = frozenset({'true', 'yes', '1', 'on', 'y', 't'})
+
+    # Inclusive bounds for integer settings (None = no upper bound). These only reject
+    # values the code can't work with; every reset goes to a default inside the bounds,
+    # so a retention count is never lowered below what the user asked for.
+    _INT_RANGES = (
+        ("max_backups", 1, None),
+        ("backup_interval", 1, None),
+        ("backup_compresslevel", 0, 9),
+        ("watchdog_interval", 1, None),
+        ("max_restarts", 0, None),
+        ("restart_cooldown", 0, None),
+        ("console_history", 0, None),
+        ("stop_timeout", 0, None),
+    )
+    _INT_BOUNDS = {key: (lo, hi) for key, lo, hi in _INT_RANGES}
+    # Unrolled at import time; returns the (key, lo, hi) entries it reset
+    _check_ranges = staticmethod(_build_range_checker(_INT_RANGES, DEFAULTS))
+
+    # Changes whenever the defaults or bounds do, invalidating cached signatures
+    _SCHEMA_TAG = format(zlib.crc32(repr((sorted(DEFAULTS.items()), _INT_RANGES)).encode()), '08x')
+
+    __slots__ = ('_config_path', '_data', '_values', '_loaded', '_batch_depth', '_dirty', '_dir_ensured', '_summary_cache')
 
     def __init__(self, config_path: Path = None):
-        if config_path is None:
-            # Use platform-appropriate config directory
-            config_dir = get_config_dir()
-            config_dir.mkdir(parents=True, exist_ok=True)
-            self.config_path = config_dir / "config.json"
-        else:
-            self.config_path = config_path
-
-        self.data = {}
+        self._config_path = config_path
+        self._data = {}
+        self._values = ChainMap(self._data, self.DEFAULTS)
+        self._loaded = False
+        self._batch_depth = 0
+        self._dirty = False
+        self._dir_ensured = False
+        self._summary_cache = None
+
+    @property
+    def config_path(self) -> Path:
+        """Path of the config file (platform directory unless given explicitly)"""
+        if self._config_path is None:
+            self._config_path = get_config_dir() / "config.json"
+        return self._config_path
+
+    @property
+    def data(self) -> dict:
+        """Loaded configuration values"""
+        self._ensure_loaded()
+        return self._data
+
+    @data.setter
+    def data(self, value: dict):
+        self._data = value
+        self._values = ChainMap(value, self.DEFAULTS)
+        self._summary_cache = None
+
+    def _ensure_loaded(self):
+        """Load the config file on first use"""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._ensure_config_directory()
         self.load()
 
         # Show config location on first run
-        if not hasattr(self, '_shown_location'):
-            console.print(f"[dim]Config: {self.config_path}[/dim]")
-            self._shown_location = True
+        _get_console().print(f"[dim]Config: {self.config_path}[/dim]")
+
+    def _ensure_config_directory(self):
+        """Create the config directory once per manager"""
+        if self._dir_ensured:
+            return
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        self._dir_ensured = True
 
     def load(self):
         """Load configuration from file"""
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r') as f:
-                    self.data = json.load(f)
-                self._validate_config()
-            except (json.JSONDecodeError, IOError) as e:
-                console.print(f"[red]Error loading config: {e}[/red]")
+                self.data = self._read_config_file(self.config_path)
+                st = os.stat(self.config_path)
+                signature = [st.st_mtime_ns, st.st_size, self._SCHEMA_TAG]
+                if self._read_signature() != signature:
+                    before = dict(self.data)
+                    self._validate_config()
+                    if self.data == before:
+                        self._write_signature(signature)
+            except (ValueError, OSError) as e:
+                _get_console().print(f"[red]Error loading config: {e}[/red]")
                 self._create_default_config()
         else:
             self._create_default_config()
 
+    @property
+    def _signature_path(self) -> Path:
+        """Sidecar file holding the last clean validation signature"""
+        return self.config_path.with_name(self.config_path.name + ".sig")
+
+    def _read_signature(self):
+        """Signature of the last config file that validated cleanly, if any"""
+        try:
+            with open(self._signature_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_signature(self, signature: list):
+        """Record that the config file with this mtime/size needs no validation"""
+        tmp_path = self._signature_path.with_suffix(".sig.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(signature, f)
+            os.replace(tmp_path, self._signature_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _read_config_file(path: Path) -> dict:
+        """Parse the config file, from a read-only mapping on POSIX"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise json.JSONDecodeError("Empty config file", "", 0)
+            if os.name == 'posix':
+                with mmap.mmap(f.fileno(), 0, **_MMAP_KWARGS) as mm:
+                    with memoryview(mm) as view:
+                        return ConfigManager._parse_config_bytes(view)
+            # Windows mappings lock the file against the os.replace in save()
+            return ConfigManager._parse_config_bytes(f.read())
+
+    @staticmethod
+    def _parse_config_bytes(buf) -> dict:
+        """Decode a config buffer with the fastest available JSON backend"""
+        if msgspec is not None and orjson is None:
+            # Typed decode rejects a non-object top level while parsing
+            return msgspec.json.decode(buf, type=Dict[str, Any])
+        data = orjson.loads(buf) if orjson is not None else json.loads(bytes(buf))
+        if not isinstance(data, dict):
+            raise ValueError("Config file must contain a JSON object")
+        return data
+
     def _create_default_config(self):
         """Create default configuration"""
-        self.data = self.DEFAULTS.copy()
+        self.data = {}
         self.save()
-        console.print("[yellow]Created default configuration[/yellow]")
+        _get_console().print("[yellow]Created default configuration[/yellow]")
 
     def _validate_config(self):
         """Validate and fix configuration values"""
-        for key, default_value in self.DEFAULTS.items():
-            if key not in self.data:
-                self.data[key] = default_value
-                continue
-
+        data = self.data
+        defaults = self.DEFAULTS
+        type_map = self._TYPE_MAP
+        # Unknown keys are ignored and missing ones fall back to DEFAULTS in get(),
+        # so a well-formed file only costs this one generated call
+        for key in self._find_mismatches(data):
             # Type validation
-            if type(self.data[key]) != type(default_value):
-                try:
-                    if isinstance(default_value, bool):
-                        self.data[key] = str(self.data[key]).lower() in ('true', 'yes', '1', 'on')
-                    elif isinstance(default_value, int):
-                        self.data[key] = int(self.data[key])
-                    elif isinstance(default_value, str):
-                        self.data[key] = str(self.data[key])
-                except (ValueError, TypeError):
-                    console.print(f"[yellow]Invalid value for {key}, using default[/yellow]")
-                    self.data[key] = default_value
+            try:
+                data[key] = self._coerce_value(type_map[key], data[key])
+            except (ValueError, TypeError):
+                _get_console().print(f"[yellow]Invalid value for {key}, using default[/yellow]")
+                data[key] = defaults[key]
+
+        # Range validation
+        for key, lo, hi in self._check_ranges(data):
+            _get_console().print(f"[yellow]{self._range_message(key, lo, hi)}, using default[/yellow]")
+
+    @classmethod
+    def _coerce_value(cls, expected_type: type, value):
+        """Convert value to a setting's type, raising ValueError/TypeError if it can't be"""
+        if expected_type is bool:
+            return cls._coerce_to_bool(value)
+        if expected_type is int:
+            if isinstance(value, bool):
+                raise TypeError("boolean given for an integer setting")
+            return int(value)
+        if expected_type is str:
+            return str(value)
+        return value
+
+    def _validate_value(self, key: str, value):
+        """Validate a single setting, returning the coerced value"""
+        expected_type = self._TYPE_MAP.get(key)
+        if expected_type is None or value.__class__ is expected_type:
+            coerced = value
+        else:
+            try:
+                coerced = self._coerce_value(expected_type, value)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Invalid value for {key}: {value!r}") from e
+
+        bounds = self._INT_BOUNDS.get(key)
+        if bounds is not None:
+            lo, hi = bounds
+            if coerced < lo or (hi is not None and coerced > hi):
+                raise ValueError(self._range_message(key, lo, hi))
+        return coerced
+
+    @staticmethod
+    def _range_message(key: str, lo: int, hi) -> str:
+        """Describe the accepted range of an integer setting"""
+        if hi is None:
+            return f"{key} must be at least {lo}"
+        return f"{key} must be between {lo} and {hi}"
+
+    @classmethod
+    def _coerce_to_bool(cls, value) -> bool:
+        """Interpret a non-bool config value as a boolean"""
+        if isinstance(value, str):
+            return value.strip().lower() in cls._TRUTHY
+        return str(value) in cls._TRUTHY
 
     def save(self):
         """Save configuration to file"""
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, 'w') as f:
-            json.dump(self.data, f, indent=4, sort_keys=True)
+        self._ensure_loaded()
+        self._ensure_config_directory()
+
+        # Write every effective setting so the file doubles as a template. The ChainMap
+        # yields keys in DEFAULTS order (then any extras), so no sort is needed for stable output.
+        values = dict(self._values)
+        if orjson is not None:
+            payload = orjson.dumps(values, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        elif msgspec is not None:
+            payload = msgspec.json.format(msgspec.json.encode(values), indent=2) + b"\n"
+        else:
+            payload = json.dumps(values, indent=2).encode() + b"\n"
+
+        # Write a sibling temp file and swap it in, so a crash never leaves a torn config
+        tmp_path = self.config_path.with_suffix(".json.tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(tmp_path, flags, 0o644)
+        except FileNotFoundError:
+            # Directory was removed since we last created it
+            self._dir_ensured = False
+            self._ensure_config_directory()
+            fd = os.open(tmp_path, flags, 0o644)
+        try:
+            # No fsync: the rename already keeps readers from seeing a torn file
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.config_path)
 
     def get(self, key: str, default=None):
-        """Get configuration value"""
-        return self.data.get(key, default or self.DEFAULTS.get(key))
+        """Get configuration value, falling back to the built-in default"""
+        self._ensure_loaded()
+        return self._values.get(key, default)
+
+    def __getitem__(self, key: str):
+        """Get a known setting (raises KeyError for unknown keys)"""
+        self._ensure_loaded()
+        return self._values[key]
+
+    def to_dict(self) -> dict:
+        """Effective configuration: saved values layered over the defaults"""
+        self._ensure_loaded()
+        return dict(self._values)
 
     def set(self, key: str, value: Any):
-        """Set configuration value"""
-        self.data[key] = value
-        self.save()
+        """Set configuration value, validating just that field"""
+        try:
+            self.data[key] = self._validate_value(key, value)
+            self._summary_cache = None
+        except ValueError as e:
+            _get_console().print(f"[red]❌ {e}, keeping {self.get(key)!r}[/red]")
+            return
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save()
+
+    @contextmanager
+    def batch(self):
+        """Defer saving until the outermost batch exits
+
+        If the batch is interrupted (e.g. Ctrl-C during interactive setup) the
+        pending changes are dropped rather than saving a half-finished config.
+        """
+        if self._batch_depth == 0:
+            snapshot = dict(self.data)
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batch_depth == 1 and self._dirty:
+                self._dirty = False
+                self.data = snapshot
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._dirty:
+            self._dirty = False
+            self.save()
 
     def interactive_setup(self):
         """Interactive configuration setup"""
-        console.print(Panel.fit("🎯 Craft NeoForge Server Configuration", style="bold cyan"))
-        console.print("[dim]Press Enter to keep current values[/dim]\n")
-
-        # Server settings
-        console.print("[bold]Server Settings[/bold]")
-        self.set("server_dir", Prompt.ask("Server directory", default=self.get("server_dir")))
-
-        current_jar = self.get("jar_name")
-        if "server.jar" in current_jar:
-            # Suggest NeoForge naming
-            console.print("[yellow]💡 Consider renaming to neoforge-server.jar for clarity[/yellow]")
-
-        self.set("jar_name", Prompt.ask("JAR filename", default=self.get("jar_name")))
-        self.set("memory_min", Prompt.ask("Minimum memory (e.g., 2G)", default=self.get("memory_min")))
-        self.set("memory_max", Prompt.ask("Maximum memory (e.g., 4G)", default=self.get("memory_max")))
-
-        # Advanced Java settings
-        console.print("\n[bold]Performance Settings[/bold]")
-        console.print("[dim]NeoForge works best with G1GC and specific optimizations[/dim]")
-        if Confirm.ask("Configure Java arguments (recommended for NeoForge)?", default=True):
-            current_args = self.get("java_args")
-            console.print(f"[dim]Current: {current_args}[/dim]")
-
-            # Suggest NeoForge-optimized settings
-            suggested_args = "-XX:+UseG1GC -XX:+UnlockExperimentalVMOptions -XX:MaxGCPauseMillis=100 -XX:G1NewSizePercent=20 -XX:G1ReservePercent=20 -XX:MaxGCPauseMillis=50 -XX:G1HeapRegionSize=32M"
-
-            use_suggested = Confirm.ask("Use NeoForge-optimized Java arguments?", default=True)
-            if use_suggested:
-                self.set("java_args", suggested_args)
-                console.print("[green]✅ Applied NeoForge-optimized settings[/green]")
-            else:
-                new_args = Prompt.ask("Custom Java arguments", default=current_args)
-                self.set("java_args", new_args)
-
-        # Backup settings
-        console.print("\n[bold]Backup Settings[/bold]")
-        self.set("auto_backup", Confirm.ask("Enable automatic backups", default=self.get("auto_backup")))
-        if self.get("auto_backup"):
-            interval_hours = self.get("backup_interval") // 3600
-            new_interval = IntPrompt.ask("Backup interval (hours)", default=interval_hours)
-            self.set("backup_interval", new_interval * 3600)
-
-        self.set("max_backups", IntPrompt.ask("Maximum backups to keep", default=self.get("max_backups")))
-        self.set("backup_on_stop", Confirm.ask("Backup on server stop", default=self.get("backup_on_stop")))
-
-        # Monitoring settings
-        console.print("\n[bold]Monitoring Settings[/bold]")
-        self.set("watchdog_enabled", Confirm.ask("Enable watchdog monitoring", default=self.get("watchdog_enabled")))
-
-        if self.get("watchdog_enabled"):
-            self.set("restart_on_crash", Confirm.ask("Auto-restart on crash", default=self.get("restart_on_crash")))
-
-            if self.get("restart_on_crash"):
-                self.set("max_restarts", IntPrompt.ask("Max restart attempts", default=self.get("max_restarts")))
-                cooldown_mins = self.get("restart_cooldown") // 60
-                new_cooldown = IntPrompt.ask("Restart cooldown (minutes)", default=cooldown_mins)
-                self.set("restart_cooldown", new_cooldown * 60)
-
-        # Server shutdown settings
-        console.print("\n[bold]Shutdown Settings[/bold]")
-        console.print("[dim]NeoForge servers can be slow to stop gracefully[/dim]")
-
-        force_stop_default = self.get("force_stop", True)
-        self.set("force_stop", Confirm.ask("Use force stop by default (faster)", default=force_stop_default))
-
-        if not self.get("force_stop"):
-            timeout_default = self.get("stop_timeout", 10)
-            self.set("stop_timeout", IntPrompt.ask("Graceful stop timeout (seconds)", default=timeout_default))
+        from rich.panel import Panel
+        from rich.prompt import Prompt, Confirm, IntPrompt
+
+        console = _get_console()
+        current = self.to_dict()
+        with self.batch():
+            console.print(Panel.fit("🎯 Craft NeoForge Server Configuration", style="bold cyan"))
+            console.print("[dim]Press Enter to keep current values[/dim]\n")
+
+            # Server settings
+            console.print("[bold]Server Settings[/bold]")
+            self.set("server_dir", Prompt.ask("Server directory", default=current["server_dir"]))
+
+            if "server.jar" in current["jar_name"]:
+                # Suggest NeoForge naming
+                console.print("[yellow]💡 Consider renaming to neoforge-server.jar for clarity[/yellow]")
+
+            self.set("jar_name", Prompt.ask("JAR filename", default=current["jar_name"]))
+            self.set("memory_min", Prompt.ask("Minimum memory (e.g., 2G)", default=current["memory_min"]))
+            self.set("memory_max", Prompt.ask("Maximum memory (e.g., 4G)", default=current["memory_max"]))
+
+            # Advanced Java settings
+            console.print("\n[bold]Performance Settings[/bold]")
+            console.print("[dim]NeoForge works best with G1GC and specific optimizations[/dim]")
+            if Confirm.ask("Configure Java arguments (recommended for NeoForge)?", default=True):
+                current_args = current["java_args"]
+                console.print(f"[dim]Current: {current_args}[/dim]")
+
+                # Suggest NeoForge-optimized settings
+                suggested_args = NEOFORGE_JAVA_ARGS
+
+                use_suggested = Confirm.ask("Use NeoForge-optimized Java arguments?", default=True)
+                if use_suggested:
+                    self.set("java_args", suggested_args)
+                    console.print("[green]✅ Applied NeoForge-optimized settings[/green]")
+                else:
+                    new_args = Prompt.ask("Custom Java arguments", default=current_args)
+                    self.set("java_args", new_args)
+
+            # Backup settings
+            console.print("\n[bold]Backup Settings[/bold]")
+            auto_backup = Confirm.ask("Enable automatic backups", default=current["auto_backup"])
+            self.set("auto_backup", auto_backup)
+            if auto_backup:
+                interval_hours = current["backup_interval"] // 3600
+                new_interval = IntPrompt.ask("Backup interval (hours)", default=interval_hours)
+                self.set("backup_interval", new_interval * 3600)
+
+            self.set("max_backups", IntPrompt.ask("Maximum backups to keep", default=current["max_backups"]))
+            self.set("backup_on_stop", Confirm.ask("Backup on server stop", default=current["backup_on_stop"]))
+
+            # Monitoring settings
+            console.print("\n[bold]Monitoring Settings[/bold]")
+            watchdog_enabled = Confirm.ask("Enable watchdog monitoring", default=current["watchdog_enabled"])
+            self.set("watchdog_enabled", watchdog_enabled)
+
+            if watchdog_enabled:
+                restart_on_crash = Confirm.ask("Auto-restart on crash", default=current["restart_on_crash"])
+                self.set("restart_on_crash", restart_on_crash)
+
+                if restart_on_crash:
+                    self.set("max_restarts", IntPrompt.ask("Max restart attempts", default=current["max_restarts"]))
+                    cooldown_mins = current["restart_cooldown"] // 60
+                    new_cooldown = IntPrompt.ask("Restart cooldown (minutes)", default=cooldown_mins)
+                    self.set("restart_cooldown", new_cooldown * 60)
+
+            # Server shutdown settings
+            console.print("\n[bold]Shutdown Settings[/bold]")
+            console.print("[dim]NeoForge servers can be slow to stop gracefully[/dim]")
+
+            force_stop = Confirm.ask("Use force stop by default (faster)", default=current["force_stop"])
+            self.set("force_stop", force_stop)
+
+            if not force_stop:
+                self.set("stop_timeout", IntPrompt.ask("Graceful stop timeout (seconds)", default=current["stop_timeout"]))
 
         console.print("\n[bold green]✅ Configuration saved![/bold green]")
         console.print(f"[dim]Config file: {self.config_path.absolute()}[/dim]")
@@ -207,16 +521,17 @@ class ConfigManager:
         server_dir = Path(self.get("server_dir"))
         jar_path = server_dir / self.get("jar_name")
 
-        if not server_dir.exists():
-            issues.append(f"Server directory doesn't exist: {server_dir}")
-
-        if not jar_path.exists():
+        # A present JAR implies its directory exists, so the usual case is a single stat
+        if not os.path.exists(jar_path):
+            if not os.path.isdir(server_dir):
+                issues.append(f"Server directory doesn't exist: {server_dir}")
             issues.append(f"NeoForge server JAR not found: {jar_path}")
             issues.append("Download NeoForge from: https://neoforged.net/")
 
         backup_dir = Path(self.get("backup_dir"))
         try:
-            backup_dir.mkdir(parents=True, exist_ok=True)
+            if not os.path.isdir(backup_dir):
+                backup_dir.mkdir(parents=True, exist_ok=True)
         except PermissionError:
             issues.append(f"Cannot create backup directory: {backup_dir}")
 
@@ -226,20 +541,24 @@ class ConfigManager:
 
         from utils import validate_memory_setting, parse_memory_to_mb
 
-        if not validate_memory_setting(memory_min):
+        min_ok = validate_memory_setting(memory_min)
+        max_ok = validate_memory_setting(memory_max)
+
+        if not min_ok:
             issues.append(f"Invalid minimum memory setting: {memory_min}")
 
-        if not validate_memory_setting(memory_max):
+        if not max_ok:
             issues.append(f"Invalid maximum memory setting: {memory_max}")
 
         # Check that max >= min
-        if validate_memory_setting(memory_min) and validate_memory_setting(memory_max):
+        if min_ok and max_ok:
             min_mb = parse_memory_to_mb(memory_min)
             max_mb = parse_memory_to_mb(memory_max)
             if min_mb and max_mb and min_mb > max_mb:
                 issues.append("Minimum memory cannot be greater than maximum memory")
 
         if issues:
+            console = _get_console()
             console.print("[red]Configuration issues found:[/red]")
             for issue in issues:
                 console.print(f"  ❌ {issue}")
@@ -248,13 +567,19 @@ class ConfigManager:
         return True
 
     def get_summary(self) -> dict:
-        """Get configuration summary for display"""
-        return {
-            "server_jar": f"{self.get('server_dir')}/{self.get('jar_name')}",
-            "memory": f"{self.get('memory_min')} - {self.get('memory_max')}",
-            "auto_backup": "Enabled" if self.get("auto_backup") else "Disabled",
-            "backup_interval": f"{self.get('backup_interval') // 3600}h" if self.get("auto_backup") else "N/A",
-            "watchdog": "Enabled" if self.get("watchdog_enabled") else "Disabled",
-            "auto_restart": "Enabled" if self.get("restart_on_crash") else "Disabled",
+        """Get configuration summary for display (cached until the next set())"""
+        if self._summary_cache is not None:
+            return self._summary_cache
+        self._ensure_loaded()
+        values = self._values
+        auto_backup = values["auto_backup"]
+        self._summary_cache = {
+            "server_jar": f"{values['server_dir']}/{values['jar_name']}",
+            "memory": f"{values['memory_min']} - {values['memory_max']}",
+            "auto_backup": "Enabled" if auto_backup else "Disabled",
+            "backup_interval": f"{values['backup_interval'] // 3600}h" if auto_backup else "N/A",
+            "watchdog": "Enabled" if values["watchdog_enabled"] else "Disabled",
+            "auto_restart": "Enabled" if values["restart_on_crash"] else "Disabled",
             "server_type": "NeoForge"
         }
+        return self._summary_cache
@@ -2,37 +2,257 @@
 Status display and UI for Craft Minecraft Server Manager
 """
 
+import functools
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Any
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
-console = Console()
+console = Console(highlight=False, emoji=False)
+
+# Colored cell markup, formatted once per color rather than rebuilt on every refresh
+_STATUS_COLORS = ("green", "yellow", "red")
+_MEM_TEMPLATES = {color: f"[{color}]{{:.1f}} MB ({{:.1f}}%)[/{color}]" for color in _STATUS_COLORS}
+_PCT_TEMPLATES = {color: f"[{color}]{{:.1f}}%[/{color}]" for color in _STATUS_COLORS}
+_COUNT_TEMPLATES = {color: f"[{color}]{{}}[/{color}]" for color in _STATUS_COLORS}
+
+# (markup, color) indexed by a running flag
+_RUN_STATE = (("[red]🔴 Stopped[/red]", "red"), ("[green]🟢 Running[/green]", "green"))
+
+
+def _resource_color(pct: float, warn: float, crit: float) -> str:
+    """Color for a usage percentage: green below warn, yellow below crit, red above"""
+    return _STATUS_COLORS[(pct >= warn) + (pct >= crit)]
+
+
+def _rate_color(rate: float) -> str:
+    """Color for a restart success rate (higher is better)"""
+    return _STATUS_COLORS[2 - (rate >= 80) - (rate >= 95)]
+
+
+def _health_score_color(score: float) -> str:
+    """Color for a 0-100 health score (higher is better)"""
+    return _STATUS_COLORS[2 - (score >= 60) - (score >= 80)]
+
+
+@functools.lru_cache(maxsize=256)
+def _format_uptime_seconds(seconds: int) -> str:
+    """H:MM:SS (with days when needed) for a whole number of seconds"""
+    return str(timedelta(seconds=seconds))
+
+
+def _format_uptime(uptime) -> str:
+    """Uptime without microseconds, formatted once per distinct whole second"""
+    if isinstance(uptime, timedelta):
+        return _format_uptime_seconds(int(uptime.total_seconds()))
+    return str(uptime).split('.')[0]
+
+
+def _property_table(rows: List[tuple]) -> Table:
+    """Build a borderless two-column property table from collected rows"""
+    table = Table(show_header=False, box=None, padding=(0, 1))
+    table.add_column("Property", style="cyan", no_wrap=True)
+    table.add_column("Value", style="white")
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+    return table
+
+
+# Age formatters for under an hour, under a day, and a day or more
+_AGE_FORMATTERS = (
+    lambda hours: f"{hours * 60:.0f}m",
+    lambda hours: f"{hours:.1f}h",
+    lambda hours: f"{hours / 24:.1f}d",
+)
+
+
+def _format_age(age_hours: float) -> str:
+    """Compact age: minutes under an hour, hours under a day, then days"""
+    return _AGE_FORMATTERS[(age_hours >= 1) + (age_hours >= 24)](age_hours)
+
+
+# Timestamp format for rows of the restart history table
+_RESTART_TS_FMT = "%m-%d %H:%M:%S"
+
+
+class _RenderBuffer:
+    """Collects a view's renderables and prints them in a single console.print"""
+
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items: List[RenderableType] = []
+
+    def add(self, *renderables: RenderableType):
+        self.items.extend(renderables)
+
+    def flush(self):
+        if self.items:
+            console.print(Group(*self.items))
+            self.items = []
+
+
+# Live status redraws per second
+LIVE_REFRESH_PER_SECOND = 1
+
+# Seconds a status snapshot is reused before querying the server again
+STATUS_SNAPSHOT_TTL = 0.5
+
+# Once the server has been stopped for this many live refreshes, status is
+# only re-queried every IDLE_STATUS_INTERVAL seconds (the clock keeps ticking)
+IDLE_STOPPED_TICKS = 3
+IDLE_STATUS_INTERVAL = 5.0
+
+
+class _ServerStatusView:
+    """Attribute view of a server status dict, built once per status render"""
+
+    __slots__ = ("running", "pid", "can_send_commands", "uptime", "memory_usage_mb",
+                 "memory_percent", "cpu_percent", "threads", "connections",
+                 "averages", "peaks", "world_info", "config")
+
+    def __init__(self, status: Dict[str, Any]):
+        get = status.get
+        self.running = bool(get("running", False))
+        self.pid = get("pid")
+        self.can_send_commands = get("can_send_commands", False)
+        self.uptime = get("uptime")
+        self.memory_usage_mb = get("memory_usage_mb", 0)
+        self.memory_percent = get("memory_percent", 0)
+        self.cpu_percent = get("cpu_percent", 0)
+        self.threads = get("threads", 0)
+        self.connections = get("connections", 0)
+        self.averages = get("averages")
+        self.peaks = get("peaks")
+        self.world_info = get("world_info")
+        self.config = get("config") or {}
+
+
+@dataclass
+class _StatusSnapshot:
+    """Server and watchdog status captured at one moment"""
+    ts: float
+    server: Dict[str, Any]
+    watchdog: Dict[str, Any]
+    server_obj: Any
+    watchdog_obj: Any
+
+
+class LiveStatusRenderable:
+    """Renderable that pulls fresh status each time Live refreshes it"""
+
+    def __init__(self, server, watchdog):
+        self.server = server
+        self.watchdog = watchdog
+        self._stopped_ticks = 0
+        self._last_full_render = 0.0
+
+    def __rich_console__(self, console, options):
+        now = time.monotonic()
+        if (self._stopped_ticks > IDLE_STOPPED_TICKS
+                and now - self._last_full_render < IDLE_STATUS_INTERVAL):
+            # Idle stopped server: only the header clock changes
+            StatusDisplay._update_header()
+            yield StatusDisplay._layout_cache
+            return
+
+        layout = StatusDisplay._create_status_display(self.server, self.watchdog, live_update=True)
+        self._last_full_render = now
+        if StatusDisplay._snapshot.server["running"]:
+            self._stopped_ticks = 0
+        else:
+            self._stopped_ticks += 1
+        yield layout
 
 
 class StatusDisplay:
     """Enhanced status display with live updates"""
 
+    # Status layout and its panels, built once and refilled on every refresh
+    _layout_cache: Optional[Layout] = None
+    _panels: Dict[str, Panel] = {}
+
+    # Header text, re-formatted only when the wall-clock second changes
+    _last_header_sec: Optional[int] = None
+    _last_header_str = ""
+
+    # Most recent status snapshot (see STATUS_SNAPSHOT_TTL)
+    _snapshot: Optional["_StatusSnapshot"] = None
+
     @staticmethod
     def show_debug_status(server):
         """Show detailed debug information"""
         status = server.get_status()
         debug_info = status.get("debug_info", {})
+        buf = _RenderBuffer()
 
-        console.print(Panel.fit("🔍 Debug Information", style="bold yellow"))
+        buf.add(Panel.fit("🔍 Debug Information", style="bold yellow"))
 
         # Main status
         running = status["running"]
-        status_color = "green" if running else "red"
-        status_text = "🟢 Running" if running else "🔴 Stopped"
-        console.print(f"Server Status: [{status_color}]{status_text}[/{status_color}]\n")
+        status_markup, _ = _RUN_STATE[bool(running)]
+        buf.add(f"Server Status: {status_markup}\n")
 
         # Debug table
+        saved_pid = debug_info.get("saved_pid")
+        java_count = debug_info.get("java_processes_found", 0)
+        buf.add(StatusDisplay._build_debug_table(debug_info))
+
+        # Suggestions
+        tips = ["\n[bold cyan]💡 Troubleshooting Tips:[/bold cyan]"]
+
+        if not running:
+            if not saved_pid:
+                tips += [
+                    "  • No PID found - server may not have been started with Craft",
+                    "  • Try: craft start",
+                ]
+            elif not debug_info.get("pid_exists"):
+                tips += [
+                    "  • Saved PID doesn't exist - server may have crashed",
+                    "  • Try: craft start",
+                ]
+            elif java_count > 0:
+                tips += [
+                    "  • Java processes found but not tracked correctly",
+                    "  • Server may have been started outside of Craft",
+                    "  • Try: craft stop && craft start",
+                ]
+        else:
+            if status.get("uptime"):
+                uptime_str = _format_uptime(status["uptime"])
+                tips.append(f"  ✅ Server running normally (uptime: {uptime_str})")
+
+            # Command capability warnings
+            can_commands = debug_info.get("can_send_commands", False)
+            if not can_commands:
+                tips += [
+                    "  ⚠️  Cannot send commands to this server process",
+                    "  • Server was likely started outside of Craft",
+                    "  • Use 'craft restart' to enable command functionality",
+                    "  • Or stop the server manually and use 'craft start'",
+                ]
+            else:
+                tips += [
+                    "  ✅ Command sending is available",
+                    "  • Try: craft command list",
+                    "  • Try: craft command say Hello World",
+                ]
+
+        buf.add("\n".join(tips))
+        buf.flush()
+
+    @staticmethod
+    def _build_debug_table(debug_info: Dict[str, Any]) -> Table:
+        """Build the debug details table"""
         debug_table = Table(title="Debug Details", show_header=True)
         debug_table.add_column("Component", style="cyan", no_wrap=True)
         debug_table.add_column("Value", style="white")
@@ -60,8 +280,7 @@ class StatusDisplay:
         direct_poll = debug_info.get("direct_process_poll")
         if debug_info.get("direct_process") is not None:
             if direct_poll is not None:
-                debug_table.add_row("Direct Process", f"Poll result: {direct_poll}",
-                                    "❌ (terminated)" if direct_poll is not None else "✅")
+                debug_table.add_row("Direct Process", f"Poll result: {direct_poll}", "❌ (terminated)")
             else:
                 debug_table.add_row("Direct Process", "Running", "✅")
 
@@ -93,177 +312,175 @@ class StatusDisplay:
         if "java_search_error" in debug_info:
             debug_table.add_row("Java Search Error", debug_info["java_search_error"], "❌")
 
-        console.print(debug_table)
-
-        # Suggestions
-        console.print("\n[bold cyan]💡 Troubleshooting Tips:[/bold cyan]")
-
-        if not running:
-            if not saved_pid:
-                console.print("  • No PID found - server may not have been started with Craft")
-                console.print("  • Try: craft start")
-            elif not debug_info.get("pid_exists"):
-                console.print("  • Saved PID doesn't exist - server may have crashed")
-                console.print("  • Try: craft start")
-            elif java_count > 0:
-                console.print("  • Java processes found but not tracked correctly")
-                console.print("  • Server may have been started outside of Craft")
-                console.print("  • Try: craft stop && craft start")
-        else:
-            if status.get("uptime"):
-                uptime_str = str(status["uptime"]).split('.')[0]
-                console.print(f"  ✅ Server running normally (uptime: {uptime_str})")
-
-            # Command capability warnings
-            can_commands = debug_info.get("can_send_commands", False)
-            if not can_commands:
-                console.print("  ⚠️  Cannot send commands to this server process")
-                console.print("  • Server was likely started outside of Craft")
-                console.print("  • Use 'craft restart' to enable command functionality")
-                console.print("  • Or stop the server manually and use 'craft start'")
-            else:
-                console.print("  ✅ Command sending is available")
-                console.print("  • Try: craft command list")
-                console.print("  • Try: craft command say Hello World")
+        return debug_table
 
     @staticmethod
     def show_status(server, watchdog, live_update: bool = False):
         """Show comprehensive server status"""
+        if live_update:
+            # Live's own refresh thread re-renders the status once per second (1 Hz)
+            renderable = LiveStatusRenderable(server, watchdog)
+            with Live(renderable, refresh_per_second=LIVE_REFRESH_PER_SECOND, auto_refresh=True,
+                      screen=False, console=console):
+                # Timed waits so Ctrl+C is delivered promptly (an untimed wait can't be interrupted on Windows)
+                stop = threading.Event()
+                try:
+                    while not stop.wait(0.5):
+                        pass
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Live update stopped[/yellow]")
+        else:
+            console.print(StatusDisplay._create_status_display(server, watchdog))
 
-        def create_status_display():
-            layout = Layout()
+    @staticmethod
+    def _build_status_layout():
+        """Build the status layout skeleton and the panels it shows"""
+        layout = Layout()
+
+        # Split into header, main content, and footer
+        layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="main"),
+            Layout(name="footer", size=3)
+        )
 
-            # Split into header, main content, and footer
-            layout.split_column(
-                Layout(name="header", size=3),
-                Layout(name="main"),
-                Layout(name="footer", size=3)
-            )
+        # Split main content into left and right panels
+        layout["main"].split_row(
+            Layout(name="left"),
+            Layout(name="right")
+        )
 
-            # Split main content into left and right panels
-            layout["main"].split_row(
-                Layout(name="left"),
-                Layout(name="right")
-            )
+        # Split right panel into top and bottom
+        layout["right"].split_column(
+            Layout(name="right_top"),
+            Layout(name="right_bottom")
+        )
 
-            # Split right panel into top and bottom
-            layout["right"].split_column(
-                Layout(name="right_top"),
-                Layout(name="right_bottom")
-            )
+        panels = {
+            "header": Panel.fit("", style="bold cyan"),
+            "left": Panel("", title="🖥️  Server Status"),
+            "right_top": Panel("", title="🐕 Monitoring", border_style="yellow"),
+            "right_bottom": Panel("", title="⚙️  System", border_style="blue"),
+            "footer": Panel.fit("", style="dim"),
+        }
+        for name, panel in panels.items():
+            layout[name].update(panel)
 
-            # Get current status data
-            server_status = server.get_status()
-            watchdog_status = watchdog.get_status()
-
-            # Header
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            layout["header"].update(
-                Panel.fit(
-                    f"🎮 Craft Server Manager - {current_time}",
-                    style="bold cyan"
-                )
-            )
+        return layout, panels
+
+    @staticmethod
+    def _status_snapshot(server, watchdog) -> "_StatusSnapshot":
+        """Return recent server/watchdog status, re-querying once the TTL has passed"""
+        now = time.monotonic()
+        snapshot = StatusDisplay._snapshot
+        if (snapshot is None or now - snapshot.ts >= STATUS_SNAPSHOT_TTL
+                or snapshot.server_obj is not server or snapshot.watchdog_obj is not watchdog):
+            snapshot = _StatusSnapshot(now, server.get_status(), watchdog.get_status(), server, watchdog)
+            StatusDisplay._snapshot = snapshot
+        return snapshot
 
-            # Main server status table
-            status_table = StatusDisplay._create_server_status_table(server_status)
-            layout["left"].update(Panel(status_table, title="🖥️  Server Status",
-                                        border_style="green" if server_status["running"] else "red"))
+    @staticmethod
+    def _update_header():
+        """Refresh the header clock, re-formatting only when the second changes"""
+        now_sec = int(time.time())
+        if now_sec != StatusDisplay._last_header_sec:
+            current_time = datetime.fromtimestamp(now_sec).strftime('%Y-%m-%d %H:%M:%S')
+            StatusDisplay._last_header_sec = now_sec
+            StatusDisplay._last_header_str = f"🎮 Craft Server Manager - {current_time}"
+        StatusDisplay._panels["header"].renderable = StatusDisplay._last_header_str
 
-            # Monitoring status
-            monitoring_table = StatusDisplay._create_monitoring_table(watchdog_status)
-            layout["right_top"].update(Panel(monitoring_table, title="🐕 Monitoring", border_style="yellow"))
+    @staticmethod
+    def _create_status_display(server, watchdog, live_update: bool = False) -> Layout:
+        """Fill the cached status layout with fresh server/watchdog status"""
+        if StatusDisplay._layout_cache is None:
+            StatusDisplay._layout_cache, StatusDisplay._panels = StatusDisplay._build_status_layout()
+        panels = StatusDisplay._panels
 
-            # System info
-            system_table = StatusDisplay._create_system_table(server_status)
-            layout["right_bottom"].update(Panel(system_table, title="⚙️  System", border_style="blue"))
+        # Get current status data, shared by renders that land within the snapshot TTL
+        snapshot = StatusDisplay._status_snapshot(server, watchdog)
+        server_status = _ServerStatusView(snapshot.server)
+        watchdog_status = snapshot.watchdog
 
-            # Footer
-            footer_text = "Press Ctrl+C to exit"
-            if live_update:
-                footer_text += " | 🔄 Live updating..."
+        # Header
+        StatusDisplay._update_header()
 
-            layout["footer"].update(
-                Panel.fit(footer_text, style="dim")
-            )
+        # Main server status table
+        panels["left"].renderable = StatusDisplay._create_server_status_table(server_status)
+        panels["left"].border_style = _RUN_STATE[server_status.running][1]
 
-            return layout
+        # Monitoring status
+        panels["right_top"].renderable = StatusDisplay._create_monitoring_table(watchdog_status)
 
+        # System info
+        panels["right_bottom"].renderable = StatusDisplay._create_system_table(server_status)
+
+        # Footer
+        footer_text = "Press Ctrl+C to exit"
         if live_update:
-            with Live(create_status_display(), refresh_per_second=1, console=console) as live:
-                try:
-                    while True:
-                        time.sleep(1)
-                        live.update(create_status_display())
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Live update stopped[/yellow]")
-        else:
-            console.print(create_status_display())
+            footer_text += " | 🔄 Live updating..."
+        panels["footer"].renderable = footer_text
+
+        return StatusDisplay._layout_cache
 
     @staticmethod
-    def _create_server_status_table(status: Dict[str, Any]) -> Table:
+    def _create_server_status_table(status: "_ServerStatusView") -> Table:
         """Create server status table"""
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Property", style="cyan", no_wrap=True)
-        table.add_column("Value", style="white")
+        rows = []
 
         # Server status
-        if status["running"]:
-            status_text = "[green]🟢 Running[/green]"
-            table.add_row("Status", status_text)
-            table.add_row("PID", str(status["pid"]))
+        if status.running:
+            rows.append(("Status", _RUN_STATE[True][0]))
+            rows.append(("PID", str(status.pid)))
 
             # Command capability
-            can_command = status.get("can_send_commands", False)
+            can_command = status.can_send_commands
             command_text = "[green]✅ Available[/green]" if can_command else "[yellow]⚠️  Limited[/yellow]"
-            table.add_row("Commands", command_text)
+            rows.append(("Commands", command_text))
 
             if not can_command:
-                table.add_row("", "[dim]Use 'craft restart' to enable[/dim]")
+                rows.append(("", "[dim]Use 'craft restart' to enable[/dim]"))
 
             # Uptime
-            uptime_str = str(status["uptime"]).split('.')[0] if status["uptime"] else "Unknown"
-            table.add_row("Uptime", uptime_str)
+            uptime_str = _format_uptime(status.uptime) if status.uptime else "Unknown"
+            rows.append(("Uptime", uptime_str))
 
             # Memory
-            memory_mb = status["memory_usage_mb"]
-            memory_pct = status["memory_percent"]
-            memory_color = "green" if memory_pct < 70 else "yellow" if memory_pct < 90 else "red"
-            table.add_row("Memory", f"[{memory_color}]{memory_mb:.1f} MB ({memory_pct:.1f}%)[/{memory_color}]")
+            memory_mb = status.memory_usage_mb
+            memory_pct = status.memory_percent
+            memory_color = _resource_color(memory_pct, 70, 90)
+            rows.append(("Memory", _MEM_TEMPLATES[memory_color].format(memory_mb, memory_pct)))
 
             # CPU
-            cpu_pct = status["cpu_percent"]
-            cpu_color = "green" if cpu_pct < 50 else "yellow" if cpu_pct < 80 else "red"
-            table.add_row("CPU", f"[{cpu_color}]{cpu_pct:.1f}%[/{cpu_color}]")
+            cpu_pct = status.cpu_percent
+            cpu_color = _resource_color(cpu_pct, 50, 80)
+            rows.append(("CPU", _PCT_TEMPLATES[cpu_color].format(cpu_pct)))
 
             # Other stats
-            table.add_row("Threads", str(status["threads"]))
-            table.add_row("Connections", str(status["connections"]))
+            rows.append(("Threads", str(status.threads)))
+            rows.append(("Connections", str(status.connections)))
 
             # Averages
-            if "averages" in status:
-                avg = status["averages"]
-                table.add_row("", "")  # Separator
-                table.add_row("Avg Memory (5m)", f"{avg['avg_memory_mb']:.1f} MB")
-                table.add_row("Avg CPU (5m)", f"{avg['avg_cpu_percent']:.1f}%")
+            avg = status.averages
+            if avg is not None:
+                rows.append(("", ""))  # Separator
+                rows.append(("Avg Memory (5m)", f"{avg['avg_memory_mb']:.1f} MB"))
+                rows.append(("Avg CPU (5m)", f"{avg['avg_cpu_percent']:.1f}%"))
         else:
-            table.add_row("Status", "[red]🔴 Stopped[/red]")
+            rows.append(("Status", _RUN_STATE[False][0]))
 
         # Configuration info
-        config = status.get("config", {})
-        table.add_row("", "")  # Separator
-        table.add_row("JAR", config.get("jar_name", "Unknown"))
-        table.add_row("Max Memory", config.get("memory_max", "Unknown"))
-        table.add_row("Server Type", config.get("server_type", "Minecraft"))
+        config = status.config
+        rows.append(("", ""))  # Separator
+        rows.append(("JAR", config.get("jar_name", "Unknown")))
+        rows.append(("Max Memory", config.get("memory_max", "Unknown")))
+        rows.append(("Server Type", config.get("server_type", "Minecraft")))
 
-        return table
+        return _property_table(rows)
 
     @staticmethod
     def _create_monitoring_table(watchdog_status: Dict[str, Any]) -> Table:
         """Create monitoring status table"""
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Property", style="cyan", no_wrap=True)
-        table.add_column("Value", style="white")
+        rows = []
 
         # Watchdog status with more detail
         running = watchdog_status["running"]
@@ -280,76 +497,69 @@ class StatusDisplay:
             elif not running_flag:
                 watchdog_text += " [dim](stopped)[/dim]"
 
-        table.add_row("Watchdog", watchdog_text)
+        rows.append(("Watchdog", watchdog_text))
 
         # Uptime
         if watchdog_status["uptime"] and running:
-            uptime_str = str(watchdog_status["uptime"]).split('.')[0]
-            table.add_row("Monitor Uptime", uptime_str)
+            uptime_str = _format_uptime(watchdog_status["uptime"])
+            rows.append(("Monitor Uptime", uptime_str))
 
         # Auto-backup
         if watchdog_status["auto_backup_running"]:
             backup_text = "[green]🟢 Active[/green]"
         else:
             backup_text = "[red]🔴 Inactive[/red]"
-        table.add_row("Auto Backup", backup_text)
+        rows.append(("Auto Backup", backup_text))
 
         # Restart info
         restart_count = watchdog_status["restart_count"]
         if restart_count > 0:
             restart_color = "yellow" if restart_count < 3 else "red"
-            table.add_row("Restarts", f"[{restart_color}]{restart_count}[/{restart_color}]")
+            rows.append(("Restarts", _COUNT_TEMPLATES[restart_color].format(restart_count)))
 
             if watchdog_status["last_restart"]:
                 last_restart = watchdog_status["last_restart"].strftime("%H:%M:%S")
-                table.add_row("Last Restart", last_restart)
+                rows.append(("Last Restart", last_restart))
         else:
-            table.add_row("Restarts", "[green]0[/green]")
+            rows.append(("Restarts", "[green]0[/green]"))
 
         # Success rate
         success_rate = watchdog_status.get("restart_success_rate", 100)
-        if success_rate < 80:
-            rate_color = "red"
-        elif success_rate < 95:
-            rate_color = "yellow"
-        else:
-            rate_color = "green"
-        table.add_row("Success Rate", f"[{rate_color}]{success_rate:.1f}%[/{rate_color}]")
+        rate_color = _rate_color(success_rate)
+        rows.append(("Success Rate", _PCT_TEMPLATES[rate_color].format(success_rate)))
 
         # Monitoring stats
         if "monitoring_stats" in watchdog_status:
             stats = watchdog_status["monitoring_stats"]
-            table.add_row("", "")  # Separator
-            table.add_row("Checks", str(stats.get("checks_performed", 0)))
+            rows.append(("", ""))  # Separator
+            rows.append(("Checks", str(stats.get("checks_performed", 0))))
 
-        return table
+        return _property_table(rows)
 
     @staticmethod
-    def _create_system_table(status: Dict[str, Any]) -> Table:
+    def _create_system_table(status: "_ServerStatusView") -> Table:
         """Create system information table"""
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Property", style="cyan", no_wrap=True)
-        table.add_column("Value", style="white")
+        rows = []
 
         # World info if available
-        if "world_info" in status:
-            world = status["world_info"]
+        world = status.world_info
+        if world is not None:
             if world.get("exists", False):
-                table.add_row("World Size", f"{world.get('size_mb', 0):.1f} MB")
+                rows.append(("World Size", f"{world.get('size_mb', 0):.1f} MB"))
 
         # Server type
-        config = status.get("config", {})
+        config = status.config
         server_type = config.get("server_type", "Minecraft")
-        table.add_row("Server Type", server_type)
+        rows.append(("Server Type", server_type))
 
         # Performance indicators
-        if status["running"] and "peaks" in status:
-            peaks = status["peaks"]
-            table.add_row("", "")  # Separator
-            table.add_row("Peak Memory", f"{peaks['peak_memory_mb']:.1f} MB")
-            table.add_row("Peak CPU", f"{peaks['peak_cpu_percent']:.1f}%")
+        peaks = status.peaks
+        if status.running and peaks is not None:
+            rows.append(("", ""))  # Separator
+            rows.append(("Peak Memory", f"{peaks['peak_memory_mb']:.1f} MB"))
+            rows.append(("Peak CPU", f"{peaks['peak_cpu_percent']:.1f}%"))
 
-        return table
+        return _property_table(rows)
 
     @staticmethod
     def show_backups(backups: List[Dict[str, Any]]):
@@ -364,22 +574,17 @@ class StatusDisplay:
         table.add_column("Created", style="white")
         table.add_column("Age", style="dim")
 
-        for backup in backups:
-            # Calculate age
-            age = backup.get("age_hours", 0)
-            if age < 1:
-                age_str = f"{age * 60:.0f}m"
-            elif age < 24:
-                age_str = f"{age:.1f}h"
-            else:
-                age_str = f"{age / 24:.1f}d"
-
-            table.add_row(
+        rows = [
+            (
                 backup["name"],
                 f"{backup['size_mb']:.1f} MB",
                 backup["created"].strftime("%Y-%m-%d %H:%M"),
-                age_str
+                _format_age(backup.get("age_hours", 0))
             )
+            for backup in backups
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
@@ -391,9 +596,7 @@ class StatusDisplay:
         table.add_column("Value", style="white")
 
         # Basic status
-        watchdog_color = "green" if status["running"] else "red"
-        watchdog_text = "🟢 Running" if status["running"] else "🔴 Stopped"
-        table.add_row("Status", f"[{watchdog_color}]{watchdog_text}[/{watchdog_color}]")
+        table.add_row("Status", _RUN_STATE[bool(status["running"])][0])
 
         # Configuration
         config = status.get("config", {})
@@ -411,11 +614,11 @@ class StatusDisplay:
             table.add_row("Last Restart", status["last_restart"].strftime("%Y-%m-%d %H:%M:%S"))
 
         success_rate = status.get("restart_success_rate", 100)
-        rate_color = "green" if success_rate >= 95 else "yellow" if success_rate >= 80 else "red"
-        table.add_row("Success Rate", f"[{rate_color}]{success_rate:.1f}%[/{rate_color}]")
+        rate_color = _rate_color(success_rate)
+        table.add_row("Success Rate", _PCT_TEMPLATES[rate_color].format(success_rate))
 
         if status["uptime"]:
-            uptime_str = str(status["uptime"]).split('.')[0]
+            uptime_str = _format_uptime(status["uptime"])
             table.add_row("Uptime", uptime_str)
 
         # Monitoring stats
@@ -426,30 +629,33 @@ class StatusDisplay:
             table.add_row("Restart Attempts", str(stats.get("restarts_attempted", 0)))
             table.add_row("Successful Restarts", str(stats.get("restarts_successful", 0)))
 
-        console.print(table)
+        buf = _RenderBuffer()
+        buf.add(table)
 
         # Show recent restart history
         if status["restart_history"]:
-            StatusDisplay._show_restart_history(status["restart_history"])
+            StatusDisplay._show_restart_history(status["restart_history"], buf)
+
+        buf.flush()
 
     @staticmethod
-    def _show_restart_history(restart_history: List[Dict[str, Any]]):
-        """Show restart history table"""
+    def _show_restart_history(restart_history: List[Dict[str, Any]], buf: "_RenderBuffer"):
+        """Add the restart history table to buf"""
         if not restart_history:
             return
 
-        console.print("\n")
+        buf.add("\n")
         table = Table(title="📊 Recent Restart History", show_header=True, header_style="bold red")
         table.add_column("Time", style="white")
         table.add_column("Attempt #", style="yellow")
         table.add_column("Reason", style="cyan")
 
         for restart in restart_history[-10:]:  # Show last 10
-            timestamp = restart["timestamp"]
+            timestamp = restart.get("timestamp")
             if isinstance(timestamp, str):
                 time_str = timestamp
             else:
-                time_str = timestamp.strftime("%m-%d %H:%M:%S")
+                time_str = timestamp.strftime(_RESTART_TS_FMT) if timestamp else "?"
 
             table.add_row(
                 time_str,
@@ -457,7 +663,7 @@ class StatusDisplay:
                 restart.get("reason", "unknown")
             )
 
-        console.print(table)
+        buf.add(table)
 
     @staticmethod
     def show_health_report(health_report: Dict[str, Any]):
@@ -466,7 +672,7 @@ class StatusDisplay:
         score = health_report["health_score"]
         status = health_report["health_status"]
 
-        score_color = "green" if score >= 80 else "yellow" if score >= 60 else "red"
+        score_color = _health_score_color(score)
 
         health_panel = Panel.fit(
             f"[bold {score_color}]{score}/100 - {status.upper()}[/bold {score_color}]",
@@ -474,21 +680,17 @@ class StatusDisplay:
             border_style=score_color
         )
 
-        console.print(health_panel)
-
         # Issues and recommendations
+        lines = []
         if health_report["issues"]:
-            console.print("\n[bold red]🚨 Issues Detected:[/bold red]")
-            for issue in health_report["issues"]:
-                console.print(f"  • {issue}")
+            lines.append("\n[bold red]🚨 Issues Detected:[/bold red]")
+            lines += [f"  • {issue}" for issue in health_report["issues"]]
 
         if health_report["recommendations"]:
-            console.print("\n[bold cyan]💡 Recommendations:[/bold cyan]")
-            for rec in health_report["recommendations"]:
-                console.print(f"  • {rec}")
+            lines.append("\n[bold cyan]💡 Recommendations:[/bold cyan]")
+            lines += [f"  • {rec}" for rec in health_report["recommendations"]]
 
         # Summary table
-        console.print("\n")
         table = Table(title="📈 Health Summary", show_header=True)
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="white")
@@ -497,16 +699,21 @@ class StatusDisplay:
         table.add_row("Status", f"[{score_color}]{status.title()}[/{score_color}]")
 
         if health_report["uptime"]:
-            uptime_str = str(health_report["uptime"]).split('.')[0]
+            uptime_str = _format_uptime(health_report["uptime"])
             table.add_row("Monitor Uptime", uptime_str)
 
         table.add_row("Monitoring", "✅ Enabled" if health_report["monitoring_enabled"] else "❌ Disabled")
 
         success_rate = health_report["restart_success_rate"]
-        rate_color = "green" if success_rate >= 95 else "yellow" if success_rate >= 80 else "red"
-        table.add_row("Restart Success", f"[{rate_color}]{success_rate:.1f}%[/{rate_color}]")
+        rate_color = _rate_color(success_rate)
+        table.add_row("Restart Success", _PCT_TEMPLATES[rate_color].format(success_rate))
 
-        console.print(table)
+        buf = _RenderBuffer()
+        buf.add(health_panel)
+        if lines:
+            buf.add("\n".join(lines))
+        buf.add("\n", table)
+        buf.flush()
 
     @staticmethod
     def show_performance_chart(stats_history: List[Dict[str, Any]], width: int = 60):
@@ -519,14 +726,16 @@ class StatusDisplay:
         memory_values = [s["memory_mb"] for s in stats_history]
         cpu_values = [s["cpu_percent"] for s in stats_history]
 
-        console.print("\n[bold]📊 Performance Trends (Last Hour)[/bold]")
+        buf = _RenderBuffer()
+        buf.add("\n[bold]📊 Performance Trends (Last Hour)[/bold]")
 
         # Simple text-based chart
         memory_chart = StatusDisplay._create_ascii_chart(memory_values, "Memory (MB)", width)
         cpu_chart = StatusDisplay._create_ascii_chart(cpu_values, "CPU (%)", width)
 
-        console.print(Panel(memory_chart, title="💾 Memory Usage"))
-        console.print(Panel(cpu_chart, title="🖥️  CPU Usage"))
+        buf.add(Panel(memory_chart, title="💾 Memory Usage"),
+                Panel(cpu_chart, title="🖥️  CPU Usage"))
+        buf.flush()
 
     @staticmethod
     def _create_ascii_chart(values: List[float], title: str, width: int = 60) -> str:
@@ -540,22 +749,16 @@ class StatusDisplay:
         if max_val == min_val:
             return f"{title}: Constant at {max_val:.1f}"
 
-        # Normalize values to chart width
-        normalized = []
-        for val in values:
-            if max_val > min_val:
-                norm = int(((val - min_val) / (max_val - min_val)) * (width - 1))
-            else:
-                norm = 0
-            normalized.append(norm)
+        # Normalize values to chart width (max_val > min_val here)
+        span = max_val - min_val
+        # Only the last 20 points are drawn, so only those are normalized
+        normalized = [int(((val - min_val) / span) * (width - 1)) for val in values[-20:]]
 
         # Create chart
         chart_lines = [f"Max: {max_val:.1f}"]
 
-        # Add scale
-
         # Create bars
-        for i, norm_val in enumerate(normalized[-20:]):  # Show last 20 points
+        for i, norm_val in enumerate(normalized):  # Show last 20 points
             bar = "█" * norm_val + "░" * (width - norm_val - len(str(values[i])))
             chart_lines.append(f"{bar} {values[i]:.1f}")
 
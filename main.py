@@ -15,7 +15,7 @@ from rich.panel import Panel
 from rich.prompt import Confirm, IntPrompt
 from rich.table import Table
 
-from backup import BackupManager
+from backup import BackupManager, COMPRESSION_TIERS
 from config import ConfigManager
 from display import StatusDisplay
 from server import MinecraftServer
@@ -38,6 +38,7 @@ Examples:
   craft stop                              # Stop the server
   craft status --live                     # Live status monitoring
   craft backup --name weekend             # Create named backup
+  craft backup --compression fast         # Quicker, larger backup
   craft restore                           # Interactive backup restore
   craft watchdog start                    # Start monitoring
   craft command say "Hello players!"      # Send server command
@@ -82,8 +83,11 @@ Examples:
     # Backup management
     backup_parser = subparsers.add_parser("backup", help="Create backup")
     backup_parser.add_argument("--name", "-n", help="Backup name")
+    backup_parser.add_argument("--compression", "-c", choices=list(COMPRESSION_TIERS),
+                               help="Compression tier (default: backup_compresslevel from config)")
 
     subparsers.add_parser("list-backups", help="List backups")
+    subparsers.add_parser("optimize-backups", help="Remove duplicate backups")
 
     restore_parser = subparsers.add_parser("restore", help="Restore backup")
     restore_parser.add_argument("backup", nargs="?", help="Backup to restore")
@@ -115,6 +119,7 @@ Examples:
     # Initialize components
     server = MinecraftServer(config)
     backup_manager = BackupManager(config)
+    backup_manager.set_backup_hooks(server.prepare_for_backup, server.resume_after_backup)
     watchdog = Watchdog(server, backup_manager)
 
     try:
@@ -161,11 +166,14 @@ Examples:
             _show_config_info(config)
 
         elif args.command == "backup":
-            backup_manager.create_backup(args.name)
+            backup_manager.create_backup(args.name, compresslevel=args.compression)
 
         elif args.command == "list-backups":
             StatusDisplay.show_backups(backup_manager.list_backups())
 
+        elif args.command == "optimize-backups":
+            backup_manager.optimize_backups()
+
         elif args.command == "restore":
             backup_name = args.backup
             if not backup_name:
@@ -14,6 +14,9 @@ from stats import ServerStats
 
 console = Console()
 
+# Seconds to give the server to finish "save-all flush" before a backup reads the world
+BACKUP_SAVE_WAIT = 2
+
 
 def get_process_health(self) -> Dict[str, Any]:
     """Get detailed process health information"""
@@ -63,6 +66,7 @@ class MinecraftServer:
         self.stats = ServerStats()
         self.server_dir = Path(config.get("server_dir"))
         self.process = None
+        self._saving_paused = False
 
     def start(self) -> bool:
         """Start the Minecraft server"""
@@ -399,6 +403,22 @@ class MinecraftServer:
 
         return False
 
+    def prepare_for_backup(self):
+        """Flush the world to disk and pause autosave so a backup reads a consistent snapshot"""
+        if not self.can_send_commands():
+            return
+
+        if self.send_command("save-off", silent=True):
+            self._saving_paused = True
+            self.send_command("save-all flush", silent=True)
+            time.sleep(BACKUP_SAVE_WAIT)
+
+    def resume_after_backup(self):
+        """Re-enable autosave if prepare_for_backup paused it"""
+        if self._saving_paused:
+            self._saving_paused = False
+            self.send_command("save-on", silent=True)
+
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive server status"""
         is_running = self.is_running()
@@ -531,7 +551,7 @@ class MinecraftServer:
         import json
 
         export_data = {
-            "config": self.config.data,
+            "config": self.config.to_dict(),
             "status": self.get_status(),
             "world_info": self.get_world_info(),
             "export_time": datetime.now().isoformat()
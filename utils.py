@@ -2,6 +2,7 @@
 Utility functions for Craft Minecraft Server Manager
 """
 
+import functools
 import os
 import signal
 import sys
@@ -59,6 +60,7 @@ def format_uptime(uptime: timedelta) -> str:
     return format_duration(total_seconds)
 
 
+@functools.lru_cache(maxsize=128)
 def validate_memory_setting(memory_str: str) -> bool:
     """Validate memory setting format (e.g., 2G, 512M)"""
     if not memory_str:
@@ -82,6 +84,7 @@ def validate_memory_setting(memory_str: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=128)
 def parse_memory_to_mb(memory_str: str) -> Optional[int]:
     """Parse memory string to MB value"""
     if not validate_memory_setting(memory_str):
@@ -49,8 +49,9 @@ class Watchdog:
             self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.thread.start()
 
-            # Start auto-backup
+            # Start auto-backup and check existing archives in the background
             self.backup_manager.start_auto_backup()
+            self.backup_manager.start_startup_cleanup()
 
             interval = self.config.get("watchdog_interval")
             console.print(f"[green]🐕 Watchdog started (checking every {interval}s)[/green]")